@@ -1,15 +1,87 @@
 """Animator module for generating animated SVGs from static SVGs."""
 
 import re
-import xml.etree.ElementTree as ET
-import drawsvg as draw
+import hashlib
 import logging
-from typing import List, Dict, Any, Tuple, Optional
+import numpy as np
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Dict, Any, Tuple, Optional, Hashable, Iterator
+from xml.sax.saxutils import quoteattr
+
+try:
+    from lxml import etree as ET
+    using_lxml = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    using_lxml = False
+
+try:
+    from svgpathtools import parse_path
+except ImportError:
+    parse_path = None
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Path data tokens used for length estimation: group 1 matches the separator
+# between joined paths, group 2 a command and group 3 a number
+_PATH_SEP = '\x01'
+_TOK_RE = re.compile(r'(\x01)|([MLHVCSQTAZmlhvcsqtaz])|(-?\d+\.?\d*)')
+
+# Output markup; attribute placeholders without quotes expect quoteattr() values
+_SVG_HEAD = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}" viewBox={vb}>'
+)
+_SVG_FOOT = '</svg>'
+_BACKGROUND_TMPL = '<rect x="0" y="0" width="{w}" height="{h}" fill={fill} />'
+_PATH_TMPL = '<path d={d} stroke={s} stroke-width={sw} fill={f}{dash}'
+_DASH_TMPL = ' stroke-dasharray="{da}" stroke-dashoffset="{do}"'
+_ANIMATE_TMPL = (
+    '<animate attributeName="stroke-dashoffset" from="{start}" to="0" '
+    'dur="{dur}s" begin="{begin}s" fill="freeze" />'
+)
+
+
+class _LRUCache:
+    """Small bounded mapping that evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int):
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+        """
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return None
+        return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entry if needed."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+@dataclass(slots=True)
+class _Prepared:
+    """Parsed SVG data shared by the animated SVG and storyboard generators."""
+
+    svg_attrs: Dict[str, Any]
+    paths: List[Dict[str, Any]]
+    lengths: List[float]
+    total_length: float
+    cumulative: np.ndarray
+
 
 class Animator:
     """Creates animated SVGs from static vector drawings."""
@@ -23,6 +95,7 @@ class Animator:
         stroke_color: str = "#000000",
         stroke_width: float = 2.0,
         background_color: Optional[str] = None,
+        cache_size: int = 8,
     ):
         """Initialize animator with the specified parameters.
 
@@ -34,6 +107,9 @@ class Animator:
             stroke_color: Color of the stroke
             stroke_width: Width of the stroke
             background_color: Background color (None for transparent)
+            cache_size: Number of generated results to memoize; kept small
+                since each entry is a whole document and the Redis result
+                cache already catches repeated inputs across workers
         """
         self.width = width
         self.height = height
@@ -42,6 +118,41 @@ class Animator:
         self.stroke_color = stroke_color
         self.stroke_width = stroke_width
         self.background_color = background_color
+        self._result_cache = _LRUCache(cache_size)
+        self._prepared_cache = _LRUCache(cache_size)
+        # lxml parsers can be reused across documents; the stdlib one cannot
+        self._parser = (
+            ET.XMLParser(recover=True, remove_blank_text=True, huge_tree=False)
+            if using_lxml
+            else None
+        )
+
+    def _cfg_tuple(self) -> Tuple[Any, ...]:
+        """Return the settings that affect generated output, for cache keys."""
+        return (
+            self.width,
+            self.height,
+            self.fps,
+            self.animation_duration,
+            self.stroke_color,
+            self.stroke_width,
+            self.background_color,
+        )
+
+    def config_key(self) -> str:
+        """Describe the settings that affect generated output.
+
+        Returns:
+            String that changes whenever the output for a given input would
+        """
+        return repr(self._cfg_tuple())
+
+    def _cache_key(self, svg_content: str, *extra: Any) -> Tuple[Any, ...]:
+        """Build a cache key from the SVG content hash and current settings."""
+        if isinstance(svg_content, str):
+            svg_content = svg_content.encode('utf-8')
+        digest = hashlib.blake2b(svg_content, digest_size=16).digest()
+        return (digest, self._cfg_tuple(), *extra)
 
     def _parse_svg(self, svg_content: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
         """Parse SVG content and extract paths.
@@ -52,15 +163,22 @@ class Animator:
         Returns:
             Tuple containing SVG attributes and list of path data
         """
-        # Parse SVG with xml.etree
         try:
+            # Parsers are faster on bytes and this keeps an XML encoding
+            # declaration (as emitted by vtracer) legal for lxml
             if isinstance(svg_content, str):
-                # Clean up namespaces for easier parsing
-                svg_content = re.sub(r'xmlns:xlink="[^"]+"', '', svg_content)
-                svg_content = re.sub(r'xmlns="[^"]+"', '', svg_content)
-            
-            root = ET.fromstring(svg_content)
-            
+                svg_content = svg_content.encode('utf-8')
+
+            if using_lxml:
+                root = ET.fromstring(svg_content, parser=self._parser)
+                if root is None:
+                    # The recovering parser returns None for unusable input
+                    raise ValueError("No root element found")
+                path_elements = root.iter('{*}path')
+            else:
+                root = ET.fromstring(svg_content)
+                path_elements = root.iterfind('.//{*}path')
+
             # Get SVG attributes
             svg_attrs = {
                 'width': root.get('width', str(self.width)),
@@ -70,7 +188,7 @@ class Animator:
             
             # Extract paths
             paths = []
-            for path in root.findall('.//path'):
+            for path in path_elements:
                 path_data = {
                     'd': path.get('d', ''),
                     'stroke': path.get('stroke', self.stroke_color),
@@ -91,7 +209,33 @@ class Animator:
             }, []
 
     def _calculate_path_lengths(self, paths: List[Dict[str, Any]]) -> List[float]:
-        """Calculate approximate path lengths for better animation timing.
+        """Calculate path lengths for better animation timing.
+
+        Uses the arc length of the parsed path geometry when svgpathtools is
+        installed and falls back to the token-count estimate otherwise.
+
+        Args:
+            paths: List of path data dictionaries
+
+        Returns:
+            List of path lengths
+        """
+        if parse_path is None:
+            return self._estimate_path_lengths(paths)
+
+        lengths = []
+        for path in paths:
+            try:
+                length = parse_path(path['d']).length(error=1e-3)
+            except Exception as e:
+                logger.warning(f"Could not measure path, using estimate: {str(e)}")
+                length = self._estimate_path_lengths([path])[0]
+            lengths.append(max(100.0, length))  # Minimum length of 100
+
+        return lengths
+
+    def _estimate_path_lengths(self, paths: List[Dict[str, Any]]) -> List[float]:
+        """Estimate path lengths from the number of commands and points.
         
         Args:
             paths: List of path data dictionaries
@@ -100,174 +244,254 @@ class Animator:
             List of approximate path lengths
         """
         # This is a simplified approximation
-        # A more accurate method would involve actual path length calculation
-        lengths = []
-        
-        for path in paths:
-            # Count the number of commands in the path as a rough approximation
-            d = path['d']
-            # Count movement commands (M, L, C, Q, etc.)
-            commands = len(re.findall(r'[MLHVCSQTAZmlhvcsqtaz]', d))
-            # Count number points (pairs of numbers)
-            points = len(re.findall(r'-?\d+\.?\d*', d)) / 2
-            
-            # Simplified length calculation
-            length = commands * 10 + points * 5
-            lengths.append(max(100, length))  # Minimum length of 100
-            
-        return lengths
+        if not paths:
+            return []
+
+        # Scan all paths at once; every separator hit moves on to the next path
+        joined = _PATH_SEP.join(path['d'] for path in paths)
+        groups = np.fromiter(
+            (match.lastindex for match in _TOK_RE.finditer(joined)), dtype=np.int8
+        )
+        path_index = np.cumsum(groups == 1)
+        commands = np.bincount(path_index[groups == 2], minlength=len(paths))
+        points = np.bincount(path_index[groups == 3], minlength=len(paths)) / 2
+
+        # Simplified length calculation with a minimum length of 100
+        lengths = np.maximum(100.0, commands * 10 + points * 5)
+        return lengths.tolist()
+
+    def _prepare(self, svg_content: str, key: Optional[Tuple[Any, ...]] = None) -> _Prepared:
+        """Parse SVG content and measure its paths, reusing earlier results.
+
+        Args:
+            svg_content: Static SVG content
+            key: Cache key from _cache_key, computed when not given
+
+        Returns:
+            Parsed SVG attributes, paths and path lengths
+        """
+        if key is None:
+            key = self._cache_key(svg_content)
+        prep = self._prepared_cache.get(key)
+        if prep is None:
+            svg_attrs, paths = self._parse_svg(svg_content)
+            lengths = self._calculate_path_lengths(paths)
+            cumulative = np.cumsum(np.asarray(lengths, dtype=np.float64))
+            prep = _Prepared(svg_attrs, paths, lengths, sum(lengths), cumulative)
+            self._prepared_cache.put(key, prep)
+        return prep
 
     def create_animated_svg(self, svg_content: str) -> str:
         """Generate an animated SVG from a static SVG.
 
+        Results are memoized by content hash and animator settings.
+
         Args:
             svg_content: Static SVG content as string
 
         Returns:
             Animated SVG content as string
         """
-        # Parse SVG
-        svg_attrs, paths = self._parse_svg(svg_content)
-        
-        # Calculate path lengths for timing
-        path_lengths = self._calculate_path_lengths(paths)
-        total_length = sum(path_lengths)
-        
-        # Create a new SVG with drawsvg
-        d = draw.Drawing(
-            width=self.width,
-            height=self.height,
-            origin=(0, 0),
-            viewBox=svg_attrs.get('viewBox', f"0 0 {self.width} {self.height}")
-        )
-        
-        # Add background if specified
-        if self.background_color:
-            d.append(draw.Rectangle(
-                0, 0, self.width, self.height,
-                fill=self.background_color,
-            ))
-        
+        base_key = self._cache_key(svg_content)
+        key = (*base_key, 'animated')
+        animated_svg = self._result_cache.get(key)
+        if animated_svg is None:
+            animated_svg = self._build_animated_svg(self._prepare(svg_content, base_key))
+            self._result_cache.put(key, animated_svg)
+        return animated_svg
+
+    def _build_animated_svg(self, prep: _Prepared) -> str:
+        """Generate an animated SVG without consulting the cache.
+
+        Args:
+            prep: Prepared SVG data from _prepare
+
+        Returns:
+            Animated SVG content as string
+        """
+        paths = prep.paths
+        path_lengths, total_length = prep.lengths, prep.total_length
+
+        head, foot = self._svg_envelope(prep.svg_attrs)
+        parts = [head]
+
         # Animation timing parameters
         total_duration = self.animation_duration * 1000  # ms
         current_time = 0
-        
+
         # Add animated paths
-        for i, (path_data, path_length) in enumerate(zip(paths, path_lengths)):
+        for path_data, path_length in zip(paths, path_lengths):
             # Calculate timing based on path length
             duration = (path_length / total_length) * total_duration if total_length > 0 else total_duration / len(paths)
             delay = current_time
-            
-            # Create path
-            p = draw.Path(stroke=path_data.get('stroke', self.stroke_color),
-                         stroke_width=float(path_data.get('stroke-width', self.stroke_width)),
-                         fill=path_data.get('fill', 'none'),
-                         d=path_data['d'])
-            
-            # Add dash array and offset for drawing animation
-            p['stroke-dasharray'] = path_length
-            p['stroke-dashoffset'] = path_length
-            
-            # Add animation
-            anim = draw.AnimateMotion(
-                'stroke-dashoffset',
-                path_length,
-                0,
-                dur=f"{duration/1000}s",
-                begin=f"{delay/1000}s",
-                fill='freeze'
+
+            # Path starts fully hidden by its dash offset and is revealed by the animation
+            animation = _ANIMATE_TMPL.format(
+                start=path_length, dur=duration / 1000, begin=delay / 1000
             )
-            p.append(anim)
-            d.append(p)
-            
+            parts.append(self._path_element(path_data, path_length, path_length, animation))
+
             # Update current time
             current_time += duration
-        
-        # Return SVG as string
-        return d.as_str()
 
-    def storyboard_frames(self, svg_content: str, num_frames: int = 10) -> List[str]:
+        parts.append(foot)
+        return ''.join(parts)
+
+    def _svg_envelope(
+        self, svg_attrs: Dict[str, Any], background: bool = True
+    ) -> Tuple[str, str]:
+        """Build the opening and closing markup of an output document.
+
+        Args:
+            svg_attrs: SVG attributes from _parse_svg
+            background: Whether to include the background rectangle
+
+        Returns:
+            Tuple of the SVG header (including background) and footer
+        """
+        view_box = svg_attrs.get('viewBox', f"0 0 {self.width} {self.height}")
+        head = _SVG_HEAD.format(w=self.width, h=self.height, vb=quoteattr(view_box))
+        if background and self.background_color:
+            head += _BACKGROUND_TMPL.format(
+                w=self.width, h=self.height, fill=quoteattr(self.background_color)
+            )
+        return head, _SVG_FOOT
+
+    def _path_element(
+        self,
+        path_data: Dict[str, Any],
+        dash_length: Optional[float] = None,
+        dash_offset: Optional[float] = None,
+        animation: str = '',
+    ) -> str:
+        """Serialize a single path, optionally with a dash pattern and animation.
+
+        Args:
+            path_data: Path data dictionary from _parse_svg
+            dash_length: Value for stroke-dasharray, omitted when None
+            dash_offset: Value for stroke-dashoffset
+            animation: Child animation markup
+
+        Returns:
+            Path element markup
+        """
+        dash = ''
+        if dash_length is not None:
+            dash = _DASH_TMPL.format(da=dash_length, do=dash_offset)
+        element = _PATH_TMPL.format(
+            d=quoteattr(path_data['d']),
+            s=quoteattr(str(path_data.get('stroke', self.stroke_color))),
+            sw=quoteattr(str(path_data.get('stroke-width', self.stroke_width))),
+            f=quoteattr(str(path_data.get('fill', 'none'))),
+            dash=dash,
+        )
+        if animation:
+            return f'{element}>{animation}</path>'
+        return element + ' />'
+
+    def _storyboard_steps(
+        self, prep: _Prepared, num_frames: int
+    ) -> Iterator[Tuple[str, str]]:
+        """Generate the markup that changes from one storyboard frame to the next.
+
+        Args:
+            prep: Prepared SVG from _prepare
+            num_frames: Number of frames to generate
+
+        Yields:
+            Tuples of markup for the paths completed since the previous frame
+            and for the partially drawn path (empty strings when there are none)
+        """
+        paths, path_lengths = prep.paths, prep.lengths
+        fully_drawn = [self._path_element(path_data) for path_data in paths]
+
+        # Number of fully drawn paths per frame, found by binary search over
+        # the cumulative path lengths for all frames at once
+        if num_frames > 1:
+            progress = np.arange(num_frames) / (num_frames - 1)
+        else:
+            progress = np.ones(max(num_frames, 0))
+        # Scale by the last cumulative length rather than total_length so the
+        # final frame lands exactly on the last search boundary
+        total_length = float(prep.cumulative[-1]) if len(paths) else 0.0
+        targets = progress * total_length
+        drawn_counts = np.searchsorted(prep.cumulative, targets, side='right')
+
+        drawn = 0
+
+        for animation_progress, count in zip(targets.tolist(), drawn_counts.tolist()):
+            # Paths [drawn, count) were completed since the previous frame
+            completed = ''
+            if count > drawn:
+                completed = ''.join(fully_drawn[drawn:count])
+                drawn = count
+
+            # The next path, if any, is partially drawn
+            partial = ''
+            if drawn < len(paths):
+                drawn_length = float(prep.cumulative[drawn - 1]) if drawn else 0.0
+                path_length = path_lengths[drawn]
+                path_progress = (animation_progress - drawn_length) / path_length
+                offset = path_length * (1 - path_progress)
+                partial = self._path_element(paths[drawn], path_length, offset)
+
+            yield completed, partial
+
+    def storyboard_frames(self, svg_content: str, num_frames: int = 10) -> Iterator[str]:
         """Generate a series of SVG frames showing the animation progress.
 
+        Frames are produced lazily so callers can stream them. Fully drawn
+        paths are serialized once and reused by every later frame.
+
         Args:
             svg_content: Static SVG content
             num_frames: Number of frames to generate
 
-        Returns:
-            List of SVG content strings representing animation frames
+        Yields:
+            SVG content strings representing animation frames
         """
-        # Parse SVG
-        svg_attrs, paths = self._parse_svg(svg_content)
-        
-        # Calculate path lengths
-        path_lengths = self._calculate_path_lengths(paths)
-        total_length = sum(path_lengths)
-        
-        frames = []
-        
-        # Generate frames at different animation states
-        for frame in range(num_frames):
-            # Calculate progress (0.0 to 1.0)
-            progress = frame / (num_frames - 1) if num_frames > 1 else 1.0
-            
-            # Create SVG for this frame
-            d = draw.Drawing(
-                width=self.width,
-                height=self.height,
-                origin=(0, 0),
-                viewBox=svg_attrs.get('viewBox', f"0 0 {self.width} {self.height}")
-            )
-            
-            # Add background if specified
-            if self.background_color:
-                d.append(draw.Rectangle(
-                    0, 0, self.width, self.height,
-                    fill=self.background_color,
-                ))
-            
-            # Determine which paths should be visible and how much
-            cumulative_length = 0
-            animation_progress = progress * total_length
-            
-            for i, (path_data, path_length) in enumerate(zip(paths, path_lengths)):
-                # Calculate how much of this path to show
-                if cumulative_length > animation_progress:
-                    # Path not yet reached
-                    continue
-                
-                if cumulative_length + path_length <= animation_progress:
-                    # Path fully drawn
-                    p = draw.Path(
-                        stroke=path_data.get('stroke', self.stroke_color),
-                        stroke_width=float(path_data.get('stroke-width', self.stroke_width)),
-                        fill=path_data.get('fill', 'none'),
-                        d=path_data['d']
-                    )
-                    d.append(p)
-                else:
-                    # Path partially drawn
-                    p = draw.Path(
-                        stroke=path_data.get('stroke', self.stroke_color),
-                        stroke_width=float(path_data.get('stroke-width', self.stroke_width)),
-                        fill=path_data.get('fill', 'none'),
-                        d=path_data['d']
-                    )
-                    
-                    # Calculate dashoffset
-                    path_progress = (animation_progress - cumulative_length) / path_length
-                    offset = path_length * (1 - path_progress)
-                    
-                    p['stroke-dasharray'] = path_length
-                    p['stroke-dashoffset'] = offset
-                    
-                    d.append(p)
-                
-                cumulative_length += path_length
-            
-            # Add frame to list
-            frames.append(d.as_str())
-        
-        return frames
+        prep = self._prepare(svg_content)
+        head, foot = self._svg_envelope(prep.svg_attrs)
+
+        drawn_markup = ''
+        for completed, partial in self._storyboard_steps(prep, num_frames):
+            drawn_markup += completed
+            yield head + drawn_markup + partial + foot
+
+    def storyboard_deltas(
+        self, svg_content: str, num_frames: int = 10
+    ) -> Iterator[Tuple[Optional[str], Optional[str]]]:
+        """Generate the storyboard as per-frame changes instead of full frames.
+
+        Each frame of storyboard_frames is the previous frame's completed
+        paths plus the paths completed since, with the partially drawn path
+        on top. Rendering the two documents yielded here and painting them
+        over the accumulated image reproduces that frame without drawing
+        earlier paths again.
+
+        Args:
+            svg_content: Static SVG content
+            num_frames: Number of frames to generate
+
+        Yields:
+            Tuples of an SVG document with the newly completed paths (the
+            first one also carries the background) and an SVG document with
+            the partially drawn path; either is None when empty
+        """
+        prep = self._prepare(svg_content)
+        first_head, foot = self._svg_envelope(prep.svg_attrs)
+        head, _ = self._svg_envelope(prep.svg_attrs, background=False)
+
+        for i, (completed, partial) in enumerate(self._storyboard_steps(prep, num_frames)):
+            completed_doc = None
+            if i == 0 and (completed or self.background_color):
+                completed_doc = first_head + completed + foot
+            elif completed:
+                completed_doc = head + completed + foot
+
+            partial_doc = head + partial + foot if partial else None
+
+            yield completed_doc, partial_doc
 
 
 # Create default animator instance
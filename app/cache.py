@@ -0,0 +1,206 @@
+"""Cache module for content-addressed pipeline results in Redis."""
+
+import hashlib
+import io
+import logging
+import threading
+from typing import BinaryIO, Optional, Tuple, Union
+
+import redis
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# Read size for hashing a download as it streams in
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+def _new_hash():
+    """Create a content hash, BLAKE3 if available, else BLAKE2b."""
+    if blake3 is not None:
+        return blake3.blake3()
+    return hashlib.blake2b(digest_size=32)
+
+
+def read_with_digest(
+    file_obj: BinaryIO, chunk_size: int = READ_CHUNK_SIZE
+) -> Tuple[bytes, str]:
+    """Read a file to the end, hashing it in the same pass.
+
+    Args:
+        file_obj: File object to read
+        chunk_size: Bytes to read at a time
+
+    Returns:
+        Tuple[bytes, str]: File content and its hex digest
+    """
+    content = io.BytesIO()
+    digest = _new_hash()
+    while chunk := file_obj.read(chunk_size):
+        content.write(chunk)
+        digest.update(chunk)
+    return content.getvalue(), digest.hexdigest()
+
+
+def make_key(namespace: str, content_digest: str, config_key: str) -> str:
+    """Build a cache key from content and the settings that produced a result.
+
+    Args:
+        namespace: Key prefix naming the kind of result
+        content_digest: Hex digest of the input the result was computed from
+        config_key: Settings that affect the result
+
+    Returns:
+        str: Cache key
+    """
+    config_digest = hashlib.blake2b(config_key.encode("utf-8"), digest_size=8).hexdigest()
+    return f"{namespace}:{content_digest}:{config_digest}"
+
+
+class NullCache:
+    """Cache that stores nothing, used when Redis is unavailable."""
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[str]: Always None
+        """
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a result.
+
+        Args:
+            key: Cache key
+            value: Result to store
+        """
+
+
+class RedisCache:
+    """Cache of intermediate pipeline results in Redis.
+
+    Entries expire after a TTL; Redis evicts them earlier under memory
+    pressure when configured with a volatile-lru policy.
+    """
+
+    def __init__(
+        self,
+        host: str = settings.REDIS_HOST,
+        port: str = settings.REDIS_PORT,
+        db: int = settings.CACHE_REDIS_DB,
+        ttl: int = settings.CACHE_TTL,
+    ):
+        """Initialize the Redis client and check the connection.
+
+        Args:
+            host: Redis host
+            port: Redis port
+            db: Redis database number
+            ttl: Entry lifetime in seconds
+        """
+        # A stalled server turns into a cache miss instead of a hung job
+        self.client = redis.Redis(
+            host=host,
+            port=int(port),
+            db=db,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+        )
+        self.client.ping()
+        self.ttl = ttl
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[str]: Cached result or None on a miss or Redis error
+        """
+        try:
+            value = self.client.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"Cache read failed for {key}: {e}")
+            return None
+        return value.decode("utf-8") if value is not None else None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a result.
+
+        Args:
+            key: Cache key
+            value: Result to store
+        """
+        try:
+            self.client.setex(key, self.ttl, value.encode("utf-8"))
+        except redis.RedisError as e:
+            logger.warning(f"Cache write failed for {key}: {e}")
+
+
+class LazyCache:
+    """Result cache that connects to Redis on first use.
+
+    Importing the module never waits on the network; if Redis cannot be
+    reached on first use, results are not cached for the life of the
+    process.
+    """
+
+    def __init__(self):
+        """Initialize without connecting."""
+        self._backend: Optional[Union[RedisCache, NullCache]] = None
+        self._lock = threading.Lock()
+
+    def _get_backend(self) -> Union[RedisCache, NullCache]:
+        """Get the underlying cache, connecting to Redis on the first call.
+
+        Returns:
+            Union[RedisCache, NullCache]: Redis cache, or NullCache if Redis
+            is unavailable
+        """
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    try:
+                        self._backend = RedisCache()
+                        logger.info("Using Redis for the result cache")
+                    except Exception as e:
+                        logger.warning(f"Redis cache unavailable: {e}")
+                        logger.warning("Pipeline results will not be cached")
+                        self._backend = NullCache()
+        return self._backend
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[str]: Cached result or None
+        """
+        return self._get_backend().get(key)
+
+    def set(self, key: str, value: str) -> None:
+        """Store a result.
+
+        Args:
+            key: Cache key
+            value: Result to store
+        """
+        self._get_backend().set(key, value)
+
+
+# Create a cache instance; it falls back to no caching on first use
+cache = LazyCache()
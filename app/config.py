@@ -1,5 +1,7 @@
 """Configuration module for the application."""
 
+from functools import lru_cache
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
@@ -18,10 +20,15 @@ class Settings(BaseSettings):
     POSTGRES_DB: str = "sketch_app"
     POSTGRES_PORT: str = "5432"
     DATABASE_URL: Optional[str] = None
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
     
     # Redis configuration
     REDIS_HOST: str = "localhost"
     REDIS_PORT: str = "6379"
+    CACHE_REDIS_DB: int = 1
+    CACHE_TTL: int = 86400
     
     # Minio configuration
     MINIO_ROOT_USER: str = "minioadmin"
@@ -35,15 +42,30 @@ class Settings(BaseSettings):
     VIDEO_HEIGHT: int = 1080
     VIDEO_FPS: int = 30
     
+    # Seconds after which a job still PROCESSING is treated as abandoned
+    JOB_STALE_AFTER: int = 3600
+    
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", case_sensitive=True)
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    @model_validator(mode="after")
+    def assemble_database_url(self) -> "Settings":
+        """Build DATABASE_URL from the PostgreSQL settings when not given."""
         if not self.DATABASE_URL:
             self.DATABASE_URL = (
                 f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@"
                 f"{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
             )
+        return self
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings, loading them on first use.
+
+    Returns:
+        Settings: Cached settings instance
+    """
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
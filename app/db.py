@@ -14,7 +14,14 @@ logger = logging.getLogger(__name__)
 # Check if PostgreSQL is available
 try:
     # Create async engine with PostgreSQL
-    engine = create_async_engine(settings.DATABASE_URL, echo=True, future=True)
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=settings.DB_ECHO,
+        future=True,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+    )
     logger.info(f"Using PostgreSQL database: {settings.POSTGRES_DB} on {settings.POSTGRES_SERVER}")
     using_sqlite = False
 except Exception as e:
@@ -27,7 +34,12 @@ except Exception as e:
     sqlite_url = f"sqlite+aiosqlite:///{sqlite_file}"
     
     # Create engine with SQLite
-    engine = create_async_engine(sqlite_url, echo=True, future=True, connect_args={"check_same_thread": False})
+    engine = create_async_engine(
+        sqlite_url,
+        echo=settings.DB_ECHO,
+        future=True,
+        connect_args={"check_same_thread": False},
+    )
     using_sqlite = True
 
 # Create async session
@@ -1,10 +1,14 @@
 """Main FastAPI application."""
 
 import uuid
+import time
 import logging
+from anyio import to_thread
 from fastapi import FastAPI, Depends, HTTPException, UploadFile, File, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from typing import Dict, List, Any, Optional
@@ -13,15 +17,36 @@ import aiofiles
 from datetime import datetime
 
 from app.config import settings
-from app.db import get_db, init_db
+from app.db import async_session, get_db, init_db
 from app.models import Job, JobStatus, JobCreate, JobResponse, JobsListResponse
 from app.storage import storage
-from app.tasks import celery_app, redis_available
+from app.tasks import celery_app, enqueue_many, redis_available
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Validates a whole page of ORM rows in one call
+_JOBS_ADAPTER = TypeAdapter(List[JobResponse])
+
+# Read size for streaming upload validation
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUID version 7 (RFC 9562).
+
+    Returns:
+        uuid.UUID: UUID whose leading 48 bits are the Unix time in milliseconds
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & ((1 << 48) - 1)) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    # Set version (7) and variant (0b10) bits
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
@@ -37,6 +62,25 @@ app.add_middleware(
 )
 
 
+def schedule_job(job_id: int, input_path: str) -> None:
+    """Send the processing task for a job to the Celery broker.
+
+    Args:
+        job_id: Job ID
+        input_path: Storage path of the uploaded file, so the worker can
+            start downloading it while it loads the job
+    """
+    try:
+        celery_app.send_task(
+            "app.tasks.process_sketch", args=[job_id, input_path]
+        )
+        logger.info(f"Task scheduled for job ID: {job_id}")
+    except Exception as e:
+        logger.error(f"Failed to schedule task: {e}")
+        # No need to fail the request if task scheduling fails
+        # The user can still check status and retry later
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize DB on startup."""
@@ -49,6 +93,20 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
     
+    # Requeue pending jobs whose task may never have been sent, e.g. because
+    # the broker was down; a job already picked up is not claimed twice
+    try:
+        async with async_session() as db:
+            result = await db.execute(
+                select(Job.id, Job.input_path).where(Job.status == JobStatus.PENDING)
+            )
+            pending_jobs = [tuple(row) for row in result.all()]
+        if pending_jobs:
+            await to_thread.run_sync(enqueue_many, pending_jobs)
+            logger.info(f"Requeued {len(pending_jobs)} pending jobs")
+    except Exception as e:
+        logger.error(f"Failed to requeue pending jobs: {e}")
+    
     # Log service status
     if not redis_available:
         logger.warning("Running in LOCAL DEVELOPMENT MODE (no Redis, no Docker)")
@@ -79,27 +137,19 @@ async def health_check() -> Dict[str, str]:
 async def create_job(
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    db: AsyncSession = Depends(get_db),
 ) -> JobResponse:
     """Create a new job.
 
+    The database session is opened only after the upload has finished, so
+    no pooled connection is held for the duration of the transfer.
+
     Args:
         background_tasks: FastAPI background tasks
         file: Uploaded sketch file
-        db: Database session
 
     Returns:
         JobResponse: Created job
     """
-    # Validate file size
-    content = await file.read()
-    file_size_mb = len(content) / (1024 * 1024)
-    if file_size_mb > settings.MAX_IMAGE_SIZE_MB:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File size exceeds the limit of {settings.MAX_IMAGE_SIZE_MB} MB",
-        )
-    
     # Validate file type
     allowed_types = {"image/jpeg", "image/png"}
     if file.content_type not in allowed_types:
@@ -108,17 +158,34 @@ async def create_job(
             detail="Only JPEG and PNG files are supported",
         )
     
+    # Validate file size without holding the whole upload in memory
+    max_size = settings.MAX_IMAGE_SIZE_MB * 1024 * 1024
+    file_size = file.size
+    if file_size is None:
+        file_size = 0
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > max_size:
+                break
+    if file_size > max_size:
+        raise HTTPException(
+            status_code=400,
+            detail=f"File size exceeds the limit of {settings.MAX_IMAGE_SIZE_MB} MB",
+        )
+    
     # Reset file pointer
     await file.seek(0)
     
     # Generate unique filename for storage
     file_ext = os.path.splitext(file.filename)[1].lower()
-    unique_id = str(uuid.uuid4())
+    unique_id = uuid7().hex
     storage_path = f"uploads/{unique_id}{file_ext}"
     
     # Upload file to storage
     try:
-        storage.upload_file(file.file, storage_path, file.content_type)
+        await to_thread.run_sync(
+            storage.upload_file, file.file, storage_path, file.content_type
+        )
         logger.info(f"File uploaded to storage: {storage_path}")
     except Exception as e:
         logger.error(f"File upload failed: {e}")
@@ -130,19 +197,13 @@ async def create_job(
         original_filename=file.filename,
         input_path=storage_path,
     )
-    db.add(job)
-    await db.commit()
-    await db.refresh(job)
+    async with async_session() as db:
+        db.add(job)
+        await db.commit()
     logger.info(f"Created job with ID: {job.id}")
     
-    # Start processing task
-    try:
-        celery_app.send_task("app.tasks.process_sketch", args=[job.id])
-        logger.info(f"Task scheduled for job ID: {job.id}")
-    except Exception as e:
-        logger.error(f"Failed to schedule task: {e}")
-        # No need to fail the request if task scheduling fails
-        # The user can still check status and retry later
+    # Start processing task once the response has been sent
+    background_tasks.add_task(schedule_job, job.id, job.input_path)
     
     return JobResponse.model_validate(job)
 
@@ -181,9 +242,8 @@ async def list_jobs(
         JobsListResponse: Jobs list
     """
     # Get total count
-    total_query = select(Job).order_by(Job.created_at.desc())
-    total_result = await db.execute(total_query)
-    total = len(total_result.scalars().all())
+    total_result = await db.execute(select(func.count()).select_from(Job))
+    total = total_result.scalar_one()
     
     # Get paginated jobs
     jobs_query = (
@@ -195,7 +255,9 @@ async def list_jobs(
     jobs_result = await db.execute(jobs_query)
     jobs = jobs_result.scalars().all()
     
-    return JobsListResponse(jobs=[JobResponse.model_validate(job) for job in jobs], total=total)
+    return JobsListResponse(
+        jobs=_JOBS_ADAPTER.validate_python(jobs, from_attributes=True), total=total
+    )
 
 
 @app.get(f"{settings.API_V1_STR}/result/{{job_id}}")
@@ -223,7 +285,7 @@ async def get_result(job_id: int, db: AsyncSession = Depends(get_db)) -> Dict[st
     
     # Generate presigned URL
     try:
-        url = storage.get_file_url(job.output_path)
+        url = await to_thread.run_sync(storage.get_file_url, job.output_path)
         return {"url": url, "expires_in_seconds": 86400}  # 24 hours
     except Exception as e:
         logger.error(f"Failed to get file URL: {e}")
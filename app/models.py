@@ -3,9 +3,10 @@
 from datetime import datetime
 from enum import Enum
 from sqlalchemy import Column, Integer, String, DateTime, Text, Enum as SQLEnum
+from sqlalchemy.sql import func
 from typing import Optional, List
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field
 from app.db import Base
 
 
@@ -22,6 +23,8 @@ class Job(Base):
     """Job database model."""
 
     __tablename__ = "jobs"
+    # Fetch server-generated timestamps with RETURNING instead of a refresh
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     status = Column(SQLEnum(JobStatus), default=JobStatus.PENDING, nullable=False)
@@ -29,8 +32,12 @@ class Job(Base):
     input_path = Column(String, nullable=False)
     output_path = Column(String, nullable=True)
     error_message = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
+    )
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
 
 
 class JobCreate(BaseModel):
@@ -42,6 +49,8 @@ class JobCreate(BaseModel):
 class JobResponse(BaseModel):
     """Schema for job response."""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
     status: JobStatus
     original_filename: str
@@ -50,14 +59,11 @@ class JobResponse(BaseModel):
     output_path: Optional[str] = None
     error_message: Optional[str] = None
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
-
 
 class JobsListResponse(BaseModel):
     """Schema for jobs list response."""
 
+    model_config = ConfigDict(frozen=True)
+
     jobs: List[JobResponse]
     total: int
@@ -1,21 +1,236 @@
 """Renderer module for generating frames and compiling video."""
 
+import io
 import os
+import itertools
 import subprocess
 import tempfile
-import cairosvg
+import time
 import numpy as np
 import logging
+import threading
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict, Any, Union
+from typing import Iterable, Iterator, List, Optional, Tuple, Dict, Any, Union
 from PIL import Image
-from moviepy.editor import ImageSequenceClip, VideoFileClip, CompositeVideoClip, ImageClip
+import billiard
+
+try:
+    import skia
+except ImportError:
+    skia = None
+
+try:
+    import pyvips
+except (ImportError, OSError):
+    # pyvips raises OSError when libvips itself is missing
+    pyvips = None
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+try:
+    import cairosvg
+except (ImportError, OSError):
+    # cairosvg raises OSError when the cairo library itself is missing
+    cairosvg = None
 
 from app.config import settings
 from app.animator import animator
 
 logger = logging.getLogger(__name__)
 
+# Seconds between checks for the next finished Blender frame
+HAND_FRAME_POLL_INTERVAL = 0.05
+
+# Raster surfaces reused across frames, per process and frame size
+_surfaces: Dict[Tuple[int, int], Any] = {}
+
+# Rasterization worker pool of the current process, started on first use
+_pool: Optional[Any] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def _rasterize(svg_data: bytes, width: int, height: int) -> np.ndarray:
+    """Rasterize an SVG document to an RGBA pixel array.
+
+    Kept at module level so it can run in pool workers. With skia-python
+    the raster surface is allocated once per process and size and cleared
+    between frames; otherwise the document is rendered with cairosvg.
+
+    Args:
+        svg_data: UTF-8 encoded SVG document
+        width: Output width in pixels
+        height: Output height in pixels
+
+    Returns:
+        (height, width, 4) uint8 RGBA array
+    """
+    if skia is not None:
+        surface = _surfaces.get((width, height))
+        if surface is None:
+            surface = skia.Surface.MakeRasterN32Premul(width, height)
+            _surfaces[(width, height)] = surface
+        canvas = surface.getCanvas()
+        canvas.clear(skia.ColorTRANSPARENT)
+        dom = skia.SVGDOM.MakeFromStream(skia.MemoryStream.MakeCopy(svg_data))
+        dom.setContainerSize(skia.Size(width, height))
+        dom.render(canvas)
+        return surface.makeImageSnapshot().toarray(
+            colorType=skia.ColorType.kRGBA_8888_ColorType,
+            alphaType=skia.AlphaType.kUnpremul_AlphaType,
+        )
+
+    if cairosvg is None:
+        raise RuntimeError("No SVG rasterizer available; install skia-python or cairosvg")
+
+    png_data = cairosvg.svg2png(
+        bytestring=svg_data,
+        output_width=width,
+        output_height=height,
+    )
+    with Image.open(io.BytesIO(png_data)) as image:
+        if image.mode != "RGBA":
+            image = image.convert("RGBA")
+        return np.asarray(image)
+
+
+def _get_pool(workers: int) -> Any:
+    """Get the process's rasterization pool, starting it on first use.
+
+    The pool comes from billiard, which unlike multiprocessing lets the
+    daemonic Celery prefork children start workers. Workers are forked from
+    a forkserver rather than from the caller, which runs the job event loop
+    and upload threads. The pool is kept for later renders so workers keep
+    their raster surfaces.
+
+    Args:
+        workers: Number of worker processes
+
+    Returns:
+        billiard.pool.Pool: Worker pool
+    """
+    global _pool, _pool_pid
+    
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = billiard.get_context("forkserver").Pool(workers)
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def _load_rgba(path: str) -> np.ndarray:
+    """Decode an image file to an RGBA pixel array.
+
+    Uses libvips through pyvips when available, which decodes PNGs faster
+    than Pillow, and falls back to Pillow otherwise.
+
+    Args:
+        path: Image file path
+
+    Returns:
+        (height, width, 4) uint8 RGBA array
+    """
+    if pyvips is not None:
+        image = pyvips.Image.new_from_file(path, access="sequential")
+        if image.format != "uchar":
+            image = image.cast("uchar", shift=True)
+        if image.bands < 3:
+            image = image.colourspace("srgb")
+        if not image.hasalpha():
+            image = image.addalpha()
+        return image.numpy()
+    
+    with Image.open(path) as image:
+        if image.mode != "RGBA":
+            image = image.convert("RGBA")
+        return np.asarray(image)
+
+
+def _blend_over(base: np.ndarray, overlay: np.ndarray) -> np.ndarray:
+    """Alpha-blend an RGBA overlay onto a base frame.
+
+    The result is treated as opaque, since video output has no alpha
+    channel, which avoids the premultiply and clipping work of a general
+    Porter-Duff "over".
+
+    Args:
+        base: (height, width, 4) uint8 base frame
+        overlay: (height, width, 4) uint8 RGBA overlay
+
+    Returns:
+        (height, width, 4) uint8 blended frame with full alpha
+    """
+    alpha = overlay[..., 3:4].astype(np.uint16)
+    blended = np.empty_like(base)
+    blended[..., :3] = (overlay[..., :3] * alpha + base[..., :3] * (255 - alpha)) // 255
+    blended[..., 3] = 255
+    return blended
+
+
+def _composite_over(base: np.ndarray, layer: np.ndarray, base_opaque: bool = False) -> np.ndarray:
+    """Paint an RGBA layer over a base frame with the Porter-Duff "over" operator.
+
+    Both frames use straight (unpremultiplied) alpha. When the base is known
+    to be opaque this reduces to _blend_over.
+
+    Args:
+        base: (height, width, 4) uint8 base frame
+        layer: (height, width, 4) uint8 layer painted on top
+        base_opaque: Whether every base pixel has full alpha
+
+    Returns:
+        (height, width, 4) uint8 composited frame
+    """
+    if base_opaque:
+        return _blend_over(base, layer)
+    
+    layer_alpha = layer[..., 3:4].astype(np.float32) / 255
+    base_weight = base[..., 3:4].astype(np.float32) / 255 * (1 - layer_alpha)
+    alpha = layer_alpha + base_weight
+    
+    color = layer[..., :3] * layer_alpha + base[..., :3] * base_weight
+    np.divide(color, alpha, out=color, where=alpha > 0)
+    
+    composited = np.empty_like(base)
+    composited[..., :3] = np.rint(color)
+    composited[..., 3:] = np.rint(alpha * 255)
+    return composited
+
+
+@lru_cache(maxsize=1)
+def _nvenc_available() -> bool:
+    """Check whether ffmpeg can encode H.264 on an NVIDIA GPU.
+
+    Listing the encoder is not enough since builds with NVENC support run
+    on machines without a GPU, so a tiny test clip is encoded instead. The
+    result is cached for the lifetime of the process.
+
+    Returns:
+        True if h264_nvenc is usable
+    """
+    probe_cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel", "error",
+        "-f", "lavfi",
+        "-i", "color=black:s=256x256:d=0.1",
+        "-c:v", "h264_nvenc",
+        "-f", "null",
+        "-",
+    ]
+    try:
+        subprocess.run(probe_cmd, capture_output=True, check=True, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    
+    logger.info("NVENC available, using h264_nvenc for MP4 output")
+    return True
+
 
 class Renderer:
     """Handles rendering of animated SVG to PNG frames and compiling to MP4."""
@@ -63,204 +278,363 @@ class Renderer:
             output_path: Path to save PNG
         """
         try:
-            cairosvg.svg2png(
-                bytestring=svg_content.encode('utf-8'),
-                write_to=output_path,
-                output_width=self.width,
-                output_height=self.height,
-            )
+            pixels = _rasterize(svg_content.encode('utf-8'), self.width, self.height)
+            Image.fromarray(pixels, "RGBA").save(output_path)
         except Exception as e:
             logger.error(f"Error converting SVG to PNG: {str(e)}")
             raise
 
-    def generate_animation_frames(self, svg_content: str, output_dir: str) -> List[str]:
-        """Generate PNG frames from animated SVG.
+    def _render_svg_batch(self, svg_list: Iterable[str]) -> Iterator[np.ndarray]:
+        """Rasterize SVG documents to RGBA pixel arrays.
+
+        Frames are fanned out to a process pool, one worker per core. At most
+        two frames per worker are in flight, so memory stays bounded when
+        the consumer is slower than rasterization.
+
+        Args:
+            svg_list: SVG documents to render
+
+        Yields:
+            (height, width, 4) uint8 RGBA arrays, in input order
+        """
+        svg_data = (svg_content.encode('utf-8') for svg_content in svg_list)
+        workers = os.cpu_count() or 1
+
+        if workers == 1:
+            for data in svg_data:
+                yield _rasterize(data, self.width, self.height)
+            return
+
+        pool = _get_pool(workers)
+        pending = deque()
+        for data in svg_data:
+            pending.append(pool.apply_async(_rasterize, (data, self.width, self.height)))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+    def generate_animation_frames(self, svg_content: str) -> Iterator[np.ndarray]:
+        """Generate raw RGBA frames from animated SVG.
+
+        Only what changes between frames is rasterized: the paths completed
+        since the previous frame are painted once onto an accumulated base
+        image, and each frame is the base with the partially drawn path on
+        top. Earlier paths are never rendered again.
 
         Args:
             svg_content: SVG content
-            output_dir: Directory to save frames
 
-        Returns:
-            List of frame file paths
+        Yields:
+            Frame pixel arrays
         """
-        frame_paths = []
-        
         try:
-            # Make sure output directory exists
-            os.makedirs(output_dir, exist_ok=True)
+            # Generate per-frame changes using animator
+            steps, documents = itertools.tee(
+                animator.storyboard_deltas(svg_content, num_frames=self.total_frames)
+            )
             
-            # Generate frames using animator
-            frame_svgs = animator.storyboard_frames(
-                svg_content, 
-                num_frames=self.total_frames
+            # Rasterize the changed documents lazily, in frame order
+            rasters = self._render_svg_batch(
+                document
+                for step in documents
+                for document in step
+                if document is not None
             )
             
-            # Convert SVGs to PNGs
-            for i, frame_svg in enumerate(frame_svgs):
-                frame_path = os.path.join(output_dir, f"frame_{i:04d}.png")
-                self.svg_to_png(frame_svg, frame_path)
-                frame_paths.append(frame_path)
+            base = np.zeros((self.height, self.width, 4), dtype=np.uint8)
+            base_opaque = False
+            for completed_doc, partial_doc in steps:
+                if completed_doc is not None:
+                    base = _composite_over(base, next(rasters), base_opaque)
+                    base_opaque = bool((base[..., 3] == 255).all())
                 
-            return frame_paths
+                if partial_doc is not None:
+                    yield _composite_over(base, next(rasters), base_opaque)
+                else:
+                    yield base
         
         except Exception as e:
             logger.error(f"Error generating animation frames: {str(e)}")
             raise
 
-    def generate_hand_frames(self, output_dir: str) -> List[str]:
-        """Generate hand animation frames using Blender.
+    def _blender_command(self, hand_output_dir: str) -> List[str]:
+        """Build the Blender command line for the hand animation.
+
+        Args:
+            hand_output_dir: Directory Blender writes frames to
+
+        Returns:
+            Command line arguments
+        """
+        return [
+            self.blender_path,
+            "--background",
+            "--python", self.blender_script_path,
+            "--",  # Pass remaining arguments to the script
+            f"--output={hand_output_dir}",
+            f"--frames={self.total_frames}",
+            f"--width={self.width}",
+            f"--height={self.height}",
+        ]
+
+    def _start_hand_render(self, output_dir: str) -> Optional[subprocess.Popen]:
+        """Start Blender rendering hand frames in the background.
+
+        Blender's output goes to a log file in output_dir rather than a pipe,
+        so its per-frame logging can never block it.
 
         Args:
             output_dir: Directory to save frames
 
         Returns:
-            List of frame file paths
+            Running Blender process, or None if hand overlay is unavailable
         """
         if not self.hand_overlay or not self.blender_script_path:
             logger.info("Hand overlay disabled or Blender script not provided")
-            return []
-            
+            return None
+        
         try:
-            # Make sure output directory exists
             hand_output_dir = os.path.join(output_dir, "hand")
             os.makedirs(hand_output_dir, exist_ok=True)
             
-            # Call Blender to generate hand animation
-            blender_cmd = [
-                self.blender_path,
-                "--background",
-                "--python", self.blender_script_path,
-                "--",  # Pass remaining arguments to the script
-                f"--output={hand_output_dir}",
-                f"--frames={self.total_frames}",
-                f"--width={self.width}",
-                f"--height={self.height}",
-            ]
+            blender_cmd = self._blender_command(hand_output_dir)
+            logger.info(f"Starting Blender: {' '.join(blender_cmd)}")
+            with open(os.path.join(output_dir, "blender.log"), "wb") as log_file:
+                return subprocess.Popen(
+                    blender_cmd,
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                )
+        
+        except Exception as e:
+            logger.error(f"Error starting Blender: {str(e)}")
+            logger.info("Continuing without hand overlay")
+            return None
+
+    def _iter_hand_frames(self, process: subprocess.Popen, output_dir: str) -> Iterator[str]:
+        """Yield hand frame paths as Blender finishes them.
+
+        Each poll lists the frame directory with a single scan. Blender
+        renders frames in order, so every frame but the newest is complete
+        while it runs, and all of them are once it has exited. Iteration
+        stops early if Blender fails; the remaining drawing frames then have
+        no overlay.
+
+        Args:
+            process: Blender process started by _start_hand_render
+            output_dir: Directory passed to _start_hand_render
+
+        Yields:
+            Paths of completed hand frames
+        """
+        hand_output_dir = os.path.join(output_dir, "hand")
+        
+        yielded = 0
+        while yielded < self.total_frames:
+            # Check Blender before scanning so an exit means every frame
+            # found by the scan is complete
+            running = process.poll() is None
+            if process.returncode:
+                with open(os.path.join(output_dir, "blender.log"), "rb") as log_file:
+                    log_tail = log_file.read()[-2000:].decode(errors="replace")
+                logger.error(f"Blender failed with error: {log_tail}")
+                logger.info("Continuing without hand overlay")
+                return
             
-            logger.info(f"Running Blender: {' '.join(blender_cmd)}")
-            result = subprocess.run(
-                blender_cmd,
-                capture_output=True,
-                text=True,
-                check=True,
+            # Zero-padded names sort in frame order
+            frame_paths = sorted(
+                entry.path
+                for entry in os.scandir(hand_output_dir)
+                if entry.name.startswith("hand_") and entry.name.endswith(".png")
             )
+            if running:
+                frame_paths = frame_paths[:-1]
+            frame_paths = frame_paths[:self.total_frames]
             
-            if result.returncode != 0:
-                logger.error(f"Blender failed with error: {result.stderr}")
-                raise Exception(f"Hand animation generation failed: {result.stderr}")
-            
-            # Collect generated frame paths
-            frame_paths = []
-            for i in range(self.total_frames):
-                frame_path = os.path.join(hand_output_dir, f"hand_{i:04d}.png")
-                if os.path.exists(frame_path):
-                    frame_paths.append(frame_path)
-            
-            return frame_paths
+            if len(frame_paths) > yielded:
+                yield from frame_paths[yielded:]
+                yielded = len(frame_paths)
+            elif not running:
+                logger.warning(f"Blender did not produce hand frame {yielded}")
+                return
+            else:
+                time.sleep(HAND_FRAME_POLL_INTERVAL)
+
+    def _resize_frame(self, pixels: np.ndarray) -> np.ndarray:
+        """Resize a frame to the video resolution.
+
+        Uses OpenCV's area interpolation when available, falling back to
+        PIL's Lanczos filter.
+
+        Args:
+            pixels: (height, width, channels) uint8 frame
+
+        Returns:
+            Frame resized to (self.height, self.width, channels)
+        """
+        if cv2 is not None:
+            return cv2.resize(
+                pixels, (self.width, self.height), interpolation=cv2.INTER_AREA
+            )
         
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Blender process error: {e.stderr}")
-            # Continue without hand overlay if Blender fails
-            logger.info("Continuing without hand overlay")
-            return []
-        except Exception as e:
-            logger.error(f"Error generating hand frames: {str(e)}")
-            # Continue without hand overlay
-            logger.info("Continuing without hand overlay")
-            return []
+        image = Image.fromarray(pixels)
+        return np.asarray(
+            image.resize((self.width, self.height), Image.Resampling.LANCZOS)
+        )
 
     def compose_frames(
-        self, drawing_frames: List[str], hand_frames: List[str], output_dir: str
-    ) -> List[str]:
+        self, drawing_frames: Iterable[np.ndarray], hand_frames: Iterable[str]
+    ) -> Iterator[np.ndarray]:
         """Compose drawing and hand frames together.
 
+        Blender renders hand frames at the video resolution, so their size
+        is only checked on the first frame; if it differs, every hand frame
+        is resized.
+
+        Drawing frames without a matching hand frame are passed through
+        unchanged.
+
         Args:
-            drawing_frames: List of drawing frame paths
-            hand_frames: List of hand frame paths
-            output_dir: Directory to save composed frames
+            drawing_frames: Drawing frame pixel arrays
+            hand_frames: Hand frame paths, in frame order
 
-        Returns:
-            List of composed frame paths
+        Yields:
+            Composed frame pixel arrays
         """
-        composed_frames = []
-        
-        try:
-            # Make sure output directory exists
-            composed_dir = os.path.join(output_dir, "composed")
-            os.makedirs(composed_dir, exist_ok=True)
-            
-            # If no hand frames, just return drawing frames
-            if not hand_frames:
-                return drawing_frames
-                
-            # Compose each frame
-            for i, drawing_path in enumerate(drawing_frames):
-                # Skip if we don't have a matching hand frame
-                if i >= len(hand_frames):
-                    break
-                    
-                # Load images
-                drawing = Image.open(drawing_path).convert("RGBA")
-                hand = Image.open(hand_frames[i]).convert("RGBA")
+        hand_frames = iter(hand_frames)
+        needs_resize = None
+        for i, drawing_frame in enumerate(drawing_frames):
+            hand_path = next(hand_frames, None)
+            if hand_path is None:
+                yield drawing_frame
+                continue
+
+            try:
+                # Load hand frame
+                hand = _load_rgba(hand_path)
                 
-                # Resize hand if needed
-                if hand.size != (self.width, self.height):
-                    hand = hand.resize((self.width, self.height), Image.Resampling.LANCZOS)
+                if needs_resize is None:
+                    needs_resize = hand.shape[:2] != (self.height, self.width)
+                    if needs_resize:
+                        logger.warning(
+                            f"Hand frames are {hand.shape[1]}x{hand.shape[0]}, "
+                            f"resizing to {self.width}x{self.height}"
+                        )
+                if needs_resize:
+                    hand = self._resize_frame(hand)
                 
                 # Compose images (hand over drawing)
-                composed = Image.alpha_composite(drawing, hand)
-                
-                # Save composed frame
-                composed_path = os.path.join(composed_dir, f"frame_{i:04d}.png")
-                composed.save(composed_path)
-                composed_frames.append(composed_path)
-                
-            return composed_frames if composed_frames else drawing_frames
-        
-        except Exception as e:
-            logger.error(f"Error composing frames: {str(e)}")
-            # Return drawing frames if composition fails
-            return drawing_frames
+                yield _blend_over(drawing_frame, hand)
+            
+            except Exception as e:
+                logger.error(f"Error composing frame {i}: {str(e)}")
+                # Fall back to the plain drawing frame
+                yield drawing_frame
 
-    def compile_video(self, frame_paths: List[str], output_path: str) -> str:
+    def compile_video(self, frames: Iterable[np.ndarray], output_path: str) -> str:
         """Compile frames into a video.
 
+        Raw pixels are streamed to an ffmpeg subprocess over stdin, so frames
+        are never encoded to or decoded from intermediate image files.
+
         Args:
-            frame_paths: List of frame paths
+            frames: Frame pixel arrays, RGB or RGBA
             output_path: Path to save video
 
         Returns:
             Path to the created video file
         """
-        try:
-            # Create clip from image sequence
-            clip = ImageSequenceClip(frame_paths, fps=self.fps)
-            
-            # Set output codec and format
-            codec = 'libx264'
-            if self.output_format == 'webm':
-                codec = 'libvpx-vp9'
-                if not output_path.endswith('.webm'):
-                    output_path = f"{os.path.splitext(output_path)[0]}.webm"
+        frames = iter(frames)
+        first_frame = next(frames, None)
+        if first_frame is None:
+            raise ValueError("No frames to compile")
+        
+        # Set output codec and format; software encoders use every core
+        threads = str(os.cpu_count() or 1)
+        if self.output_format == 'webm':
+            codec_args = [
+                "-c:v", "libvpx-vp9",
+                "-deadline", "good",
+                "-cpu-used", "4",
+                "-row-mt", "1",
+                "-tile-columns", "2",
+                "-threads", threads,
+                "-b:v", "5000k",
+            ]
+            if not output_path.endswith('.webm'):
+                output_path = f"{os.path.splitext(output_path)[0]}.webm"
+        else:
+            if _nvenc_available():
+                codec_args = [
+                    "-c:v", "h264_nvenc",
+                    "-preset", "p4",
+                    "-rc", "vbr",
+                    "-cq", "23",
+                    "-b:v", "5000k",
+                ]
             else:
-                if not output_path.endswith('.mp4'):
-                    output_path = f"{os.path.splitext(output_path)[0]}.mp4"
-            
-            # Write video file
-            clip.write_videofile(
-                output_path,
-                codec=codec,
-                fps=self.fps,
-                threads=4,
-                preset='medium',
-                bitrate='5000k',
+                codec_args = [
+                    "-c:v", "libx264",
+                    "-preset", "medium",
+                    "-tune", "animation",
+                    "-threads", threads,
+                    "-b:v", "5000k",
+                ]
+            if not output_path.endswith('.mp4'):
+                output_path = f"{os.path.splitext(output_path)[0]}.mp4"
+        
+        height, width, channels = first_frame.shape
+        ffmpeg_cmd = [
+            "ffmpeg",
+            "-y",
+            "-loglevel", "error",
+            "-f", "rawvideo",
+            "-pix_fmt", "rgba" if channels == 4 else "rgb24",
+            "-s", f"{width}x{height}",
+            "-r", str(self.fps),
+            "-i", "-",
+            *codec_args,
+            # 4:2:0 output plays everywhere; a keyframe every two seconds
+            "-pix_fmt", "yuv420p",
+            "-g", str(2 * self.fps),
+            output_path,
+        ]
+        
+        logger.info(f"Running ffmpeg: {' '.join(ffmpeg_cmd)}")
+        # ffmpeg logs to a file rather than a pipe, which it could fill and
+        # block on while we are still writing frames
+        with tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(
+                ffmpeg_cmd,
+                stdin=subprocess.PIPE,
+                stderr=stderr_file,
             )
             
-            return output_path
+            try:
+                for frame in itertools.chain([first_frame], frames):
+                    process.stdin.write(np.ascontiguousarray(frame).data)
+                process.stdin.close()
+            except BrokenPipeError:
+                # ffmpeg exited early; its stderr explains why
+                pass
+            except Exception as e:
+                logger.error(f"Error compiling video: {str(e)}")
+                process.kill()
+                process.wait()
+                raise
+            
+            process.wait()
+            if process.returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read()
+                log_tail = stderr[-2000:].decode(errors='replace')
+                logger.error(f"ffmpeg failed with error: {log_tail}")
+                raise subprocess.CalledProcessError(
+                    process.returncode, ffmpeg_cmd, stderr=stderr
+                )
         
-        except Exception as e:
-            logger.error(f"Error compiling video: {str(e)}")
-            raise
+        return output_path
 
     def render(self, svg_content: str, output_path: str) -> str:
         """Render SVG to video with all steps.
@@ -272,24 +646,29 @@ class Renderer:
         Returns:
             Path to the created video file
         """
-        # Create temporary directory for frames
+        # Create temporary directory for hand frames
         with tempfile.TemporaryDirectory() as temp_dir:
+            blender_process = None
             try:
                 logger.info(f"Starting rendering process to {output_path}")
                 
+                # Start Blender first so the hand animation renders while
+                # drawing frames are rasterized
+                if self.hand_overlay:
+                    logger.info("Generating hand frames...")
+                    blender_process = self._start_hand_render(temp_dir)
+                
                 # Generate animation frames
                 logger.info("Generating animation frames...")
-                drawing_frames = self.generate_animation_frames(svg_content, temp_dir)
+                drawing_frames = self.generate_animation_frames(svg_content)
                 
-                # Generate hand frames if enabled
+                # Compose with hand frames as Blender finishes them
                 final_frames = drawing_frames
-                if self.hand_overlay:
-                    logger.info("Generating hand frames...")
-                    hand_frames = self.generate_hand_frames(temp_dir)
-                    
-                    if hand_frames:
-                        logger.info("Composing frames...")
-                        final_frames = self.compose_frames(drawing_frames, hand_frames, temp_dir)
+                if blender_process is not None:
+                    logger.info("Composing frames...")
+                    final_frames = self.compose_frames(
+                        drawing_frames, self._iter_hand_frames(blender_process, temp_dir)
+                    )
                 
                 # Compile video
                 logger.info("Compiling video...")
@@ -301,6 +680,11 @@ class Renderer:
             except Exception as e:
                 logger.error(f"Error in render process: {str(e)}")
                 raise
+            
+            finally:
+                if blender_process is not None and blender_process.poll() is None:
+                    blender_process.kill()
+                    blender_process.wait()
 
 
 # Create default renderer instance
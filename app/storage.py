@@ -1,6 +1,5 @@
 """Storage module for handling file operations with Minio."""
 
-import os
 import io
 import logging
 from typing import BinaryIO, Optional, Tuple, Dict, Any
@@ -11,6 +10,9 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Multipart chunk size for uploads of unknown length
+UPLOAD_PART_SIZE = 16 * 1024 * 1024
+
 
 class MockStorage:
     """Mock storage handler for development without Minio."""
@@ -33,11 +35,13 @@ class MockStorage:
         Returns:
             str: Object path in storage
         """
-        # Read file content
-        file_obj.seek(0, os.SEEK_END)
-        file_size = file_obj.tell()
-        file_obj.seek(0)
-        content = file_obj.read()
+        # Take in-memory buffers' bytes without a read loop; the copy keeps
+        # the stored file independent of the caller's buffer
+        if hasattr(file_obj, "getvalue"):
+            content = file_obj.getvalue()[file_obj.tell():]
+        else:
+            content = file_obj.read()
+        file_size = len(content)
         
         # Store in memory
         self.files[object_name] = {
@@ -144,17 +148,13 @@ class MinioStorage:
             str: Object path in storage
         """
         try:
-            # Get file size
-            file_obj.seek(0, os.SEEK_END)
-            file_size = file_obj.tell()
-            file_obj.seek(0)
-
-            # Upload file
+            # Stream the file without probing its size first
             self.client.put_object(
                 bucket_name=self.bucket_name,
                 object_name=object_name,
                 data=file_obj,
-                length=file_size,
+                length=-1,
+                part_size=UPLOAD_PART_SIZE,
                 content_type=content_type,
             )
             return object_name
@@ -2,17 +2,21 @@
 
 from celery import Celery
 from celery.utils.log import get_task_logger
+from sqlalchemy import and_, or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 import asyncio
 import os
 import io
 import tempfile
-from datetime import datetime
+import threading
 import uuid
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Iterable, Optional, Tuple
 import logging
 
+from app.cache import cache, make_key, read_with_digest
 from app.config import settings
 from app.db import async_session
 from app.models import Job, JobStatus
@@ -21,6 +25,11 @@ from app.vectorizer import vectorizer
 from app.animator import animator
 from app.renderer import renderer
 
+try:
+    import uringcore
+except ImportError:
+    uringcore = None
+
 logger = get_task_logger(__name__)
 
 # Check if Redis is available
@@ -37,9 +46,9 @@ try:
         "app.tasks.process_sketch": "main-queue",
     }
     celery_app.conf.update(
-        task_serializer="json",
-        accept_content=["json"],
-        result_serializer="json",
+        task_serializer="msgpack",
+        accept_content=["msgpack"],
+        result_serializer="msgpack",
         timezone="UTC",
         enable_utc=True,
     )
@@ -65,8 +74,60 @@ except Exception as e:
     redis_available = False
 
 
-@celery_app.task(name="app.tasks.process_sketch")
-def process_sketch(job_id: int) -> dict:
+# Persistent event loop for running async job code, one per worker process
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_pid: Optional[int] = None
+_loop_lock = threading.Lock()
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, backed by io_uring when uringcore is installed.
+
+    Returns:
+        asyncio.AbstractEventLoop: New event loop
+    """
+    if uringcore is not None:
+        try:
+            return uringcore.EventLoopPolicy().new_event_loop()
+        except Exception as e:
+            # io_uring needs Linux 5.11+ and may be disabled by seccomp
+            logger.warning(f"io_uring event loop unavailable, using default loop: {e}")
+    
+    return asyncio.new_event_loop()
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the worker process's event loop, starting it on first use.
+
+    The loop runs forever in a daemon thread so the async engine and its
+    connection pool are reused across tasks instead of being rebuilt by
+    asyncio.run for each one. It is created lazily and tracked by PID since
+    threads do not survive the fork into Celery's prefork children.
+
+    Returns:
+        asyncio.AbstractEventLoop: Running event loop
+    """
+    global _loop, _loop_pid
+    
+    with _loop_lock:
+        if _loop is None or _loop_pid != os.getpid():
+            _loop = _new_event_loop()
+            # Blocking steps run on this pool instead of on the loop itself
+            _loop.set_default_executor(
+                ThreadPoolExecutor(
+                    max_workers=os.cpu_count() or 1, thread_name_prefix="job-worker"
+                )
+            )
+            threading.Thread(
+                target=_loop.run_forever, name="job-event-loop", daemon=True
+            ).start()
+            _loop_pid = os.getpid()
+        return _loop
+
+
+# Results are not stored; the job row already records the outcome
+@celery_app.task(name="app.tasks.process_sketch", ignore_result=True)
+def process_sketch(job_id: int, input_path: Optional[str] = None) -> dict:
     """Process a sketch job.
 
     This is the main Celery task that orchestrates the entire processing pipeline:
@@ -79,105 +140,175 @@ def process_sketch(job_id: int) -> dict:
 
     Args:
         job_id: Job ID
+        input_path: Storage path of the input file, if known when the task
+            was sent; lets the download start before the job is loaded
 
     Returns:
         dict: Job information
     """
     logger.info(f"Starting processing for job ID: {job_id}")
     
-    # Run async function in syncronous context
-    return asyncio.run(_process_job(job_id))
+    # Run async function on the worker's persistent event loop
+    future = asyncio.run_coroutine_threadsafe(
+        _process_job(job_id, input_path), _get_event_loop()
+    )
+    return future.result()
+
+
+def enqueue_many(jobs: Iterable[Tuple[int, str]]) -> None:
+    """Send processing tasks for several jobs in one batch.
 
+    All messages go through a single producer and broker connection taken
+    from the pool once, instead of acquiring and releasing one for every
+    send_task call. Used to requeue pending jobs when the API starts.
 
-async def _process_job(job_id: int) -> dict:
+    Args:
+        jobs: Job IDs with the storage paths of their input files, which
+            the worker prefetches
+    """
+    with celery_app.producer_or_acquire() as producer:
+        for job_id, input_path in jobs:
+            celery_app.send_task(
+                "app.tasks.process_sketch",
+                args=[job_id, input_path],
+                producer=producer,
+            )
+
+
+async def _process_job(job_id: int, input_path: Optional[str] = None) -> dict:
     """Process job asynchronously.
 
     Args:
         job_id: Job ID
+        input_path: Expected storage path of the input file, prefetched
+            while the job is claimed
 
     Returns:
         dict: Job information
     """
+    # Start downloading the input before touching the database
+    prefetch = None
+    if input_path:
+        prefetch = asyncio.ensure_future(
+            asyncio.to_thread(storage.download_file, input_path)
+        )
+    
     async with async_session() as session:
-        # Get job from database
-        job = await _get_job(session, job_id)
-        if not job:
-            logger.error(f"Job {job_id} not found")
-            return {"status": "error", "message": f"Job {job_id} not found"}
-
-        # Update job status to PROCESSING
-        job.status = JobStatus.PROCESSING
-        job.updated_at = datetime.utcnow()
+        # Claim the job, moving it to PROCESSING in the same statement
+        job = await _claim_job(session, job_id)
         await session.commit()
+        if not job:
+            await _discard(prefetch)
+            logger.error(f"Job {job_id} not found or already claimed")
+            return {"status": "error", "message": f"Job {job_id} not found or already claimed"}
 
+        # Intermediate uploads running in the background
+        uploads = []
         try:
-            # Download the input file from storage
-            logger.info(f"Downloading input file: {job.input_path}")
-            input_file, content_type = storage.download_file(job.input_path)
-            input_data = input_file.read()
+            # Download the input file from storage, unless it was prefetched
+            if prefetch is not None and input_path == job.input_path:
+                input_file, content_type = await prefetch
+            else:
+                await _discard(prefetch)
+                logger.info(f"Downloading input file: {job.input_path}")
+                input_file, content_type = await asyncio.to_thread(
+                    storage.download_file, job.input_path
+                )
+            # Hash the input while reading it; every cache key below
+            # derives from this one digest
+            try:
+                input_data, input_digest = await asyncio.to_thread(
+                    read_with_digest, input_file
+                )
+            finally:
+                _close_download(input_file)
             
-            # 1. Vectorize the image
+            # 1. Vectorize the image, reusing the result for a repeated input
             logger.info("Step 1: Vectorizing image")
-            svg_content = vectorizer.process_image(input_data)
+            svg_key = make_key("svg", input_digest, vectorizer.config_key())
+            svg_content = await asyncio.to_thread(cache.get, svg_key)
+            if svg_content is None:
+                # Off the event loop so other jobs' I/O keeps moving
+                svg_content = await asyncio.to_thread(
+                    vectorizer.process_image, input_data
+                )
+                await asyncio.to_thread(cache.set, svg_key, svg_content)
             
-            # Save intermediate SVG result
+            # Save intermediate SVG result straight from memory; the upload
+            # starts on a worker thread right away and overlaps the next steps
+            loop = asyncio.get_running_loop()
             svg_path = f"processing/{job_id}/vectorized.svg"
-            with tempfile.NamedTemporaryFile(suffix=".svg", delete=False) as temp_svg:
-                temp_svg.write(svg_content.encode('utf-8'))
-                temp_svg.flush()
-                
-                with open(temp_svg.name, 'rb') as svg_file:
-                    storage.upload_file(svg_file, svg_path, "image/svg+xml")
+            uploads.append(loop.run_in_executor(
+                None,
+                storage.upload_file,
+                io.BytesIO(svg_content.encode('utf-8')),
+                svg_path,
+                "image/svg+xml",
+            ))
             
             # 2. Create animated SVG
             logger.info("Step 2: Creating animated SVG")
-            animated_svg = animator.create_animated_svg(svg_content)
+            # The SVG is fully determined by the input and vectorizer settings
+            animated_key = make_key(
+                "animated",
+                input_digest,
+                vectorizer.config_key() + animator.config_key(),
+            )
+            animated_svg = await asyncio.to_thread(cache.get, animated_key)
+            if animated_svg is None:
+                animated_svg = await asyncio.to_thread(
+                    animator.create_animated_svg, svg_content
+                )
+                await asyncio.to_thread(cache.set, animated_key, animated_svg)
             
-            # Save animated SVG result
+            # Save animated SVG result straight from memory, overlapping rendering
             animated_svg_path = f"processing/{job_id}/animated.svg"
-            with tempfile.NamedTemporaryFile(suffix=".svg", delete=False) as temp_animated:
-                temp_animated.write(animated_svg.encode('utf-8'))
-                temp_animated.flush()
-                
-                with open(temp_animated.name, 'rb') as animated_file:
-                    storage.upload_file(animated_file, animated_svg_path, "image/svg+xml")
+            uploads.append(loop.run_in_executor(
+                None,
+                storage.upload_file,
+                io.BytesIO(animated_svg.encode('utf-8')),
+                animated_svg_path,
+                "image/svg+xml",
+            ))
             
             # 3. Render MP4 with hand animation
             logger.info("Step 3: Rendering MP4 with hand animation")
-            with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as temp_output:
-                output_path = temp_output.name
-            
-            # Render video
-            renderer.render(animated_svg, output_path)
-            
-            # Upload the rendered video to storage
             final_path = f"output/{job_id}/output.mp4"
-            with open(output_path, 'rb') as video_file:
-                storage.upload_file(video_file, final_path, "video/mp4")
+            # The scratch directory goes away even if rendering or the
+            # upload fails, whatever extension the renderer settles on
+            with tempfile.TemporaryDirectory() as temp_dir:
+                video_path = await asyncio.to_thread(
+                    renderer.render, animated_svg, os.path.join(temp_dir, "output.mp4")
+                )
+                
+                # Upload the rendered video to storage
+                with open(video_path, 'rb') as video_file:
+                    await asyncio.to_thread(
+                        storage.upload_file, video_file, final_path, "video/mp4"
+                    )
             
-            # Clean up temporary files
-            os.unlink(output_path)
+            # Intermediate uploads must have finished before completing
+            await asyncio.gather(*uploads)
             
             # Update job status and output path
-            job.status = JobStatus.COMPLETED
-            job.output_path = final_path
-            job.updated_at = datetime.utcnow()
-            await session.commit()
+            await _finish_job(
+                session, job_id, JobStatus.COMPLETED, output_path=final_path
+            )
             
             return {
                 "status": "success",
                 "job_id": job_id,
-                "output_path": job.output_path,
+                "output_path": final_path,
             }
             
         except Exception as e:
             logger.error(f"Error processing job {job_id}: {str(e)}")
             
+            # Let started uploads finish so their errors are not left unretrieved
+            await asyncio.gather(*uploads, return_exceptions=True)
+            
             # Update job status to FAILED
-            job.status = JobStatus.FAILED
-            job.error_message = str(e)
-            job.updated_at = datetime.utcnow()
-            await session.commit()
+            await _finish_job(session, job_id, JobStatus.FAILED, error_message=str(e))
             
             return {
                 "status": "error",
@@ -186,15 +317,84 @@ async def _process_job(job_id: int) -> dict:
             }
 
 
-async def _get_job(session: AsyncSession, job_id: int) -> Job:
-    """Get job from database.
+def _close_download(file_obj: Any) -> None:
+    """Close a downloaded file and return its connection to the pool.
+
+    Args:
+        file_obj: File object returned by storage.download_file
+    """
+    file_obj.close()
+    # MinIO responses hold a pooled HTTP connection until released
+    release_conn = getattr(file_obj, "release_conn", None)
+    if release_conn is not None:
+        release_conn()
+
+
+async def _discard(prefetch: Optional[asyncio.Future]) -> None:
+    """Wait for an unused prefetch and drop its result or error.
+
+    Args:
+        prefetch: Prefetch future, or None if nothing was prefetched
+    """
+    if prefetch is not None:
+        (result,) = await asyncio.gather(prefetch, return_exceptions=True)
+        if not isinstance(result, BaseException):
+            _close_download(result[0])
+
+
+async def _finish_job(
+    session: AsyncSession, job_id: int, status: JobStatus, **values: Any
+) -> None:
+    """Record a job's terminal state.
+
+    Writes the status and any other columns with one Core UPDATE and
+    commits it, without an ORM flush or refreshing the loaded job.
+
+    Args:
+        session: Database session
+        job_id: Job ID
+        status: Terminal job status
+        **values: Other columns to set, such as output_path or error_message
+    """
+    await session.execute(
+        update(Job)
+        .where(Job.id == job_id)
+        .values(status=status, **values)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+
+
+async def _claim_job(session: AsyncSession, job_id: int) -> Optional[Job]:
+    """Claim a job for processing.
+
+    Loads the job and sets its status to PROCESSING with a single
+    UPDATE ... RETURNING, so only one worker can claim a job even if the
+    task is delivered twice. Pending and failed jobs can be claimed, as can
+    jobs left PROCESSING for longer than JOB_STALE_AFTER by a worker that
+    died; completed jobs and jobs being processed cannot.
 
     Args:
         session: Database session
         job_id: Job ID
 
     Returns:
-        Job: Job object or None
+        Optional[Job]: Claimed job, or None if it does not exist or cannot be claimed
     """
-    result = await session.execute(select(Job).where(Job.id == job_id))
+    stale_before = datetime.now(timezone.utc) - timedelta(seconds=settings.JOB_STALE_AFTER)
+    result = await session.execute(
+        update(Job)
+        .where(
+            Job.id == job_id,
+            or_(
+                Job.status.in_([JobStatus.PENDING, JobStatus.FAILED]),
+                and_(
+                    Job.status == JobStatus.PROCESSING,
+                    Job.updated_at < stale_before,
+                ),
+            ),
+        )
+        .values(status=JobStatus.PROCESSING, error_message=None)
+        .returning(Job)
+    )
     return result.scalars().first()
@@ -1,19 +1,66 @@
 """Vectorizer module for converting raster images to vector SVG."""
 
 import os
+import re
 import subprocess
 import tempfile
 from pathlib import Path
 import logging
 from typing import Optional, Dict, Any, Union
 
-from PIL import Image, ImageOps
+import numpy as np
+from PIL import Image
 import io
 
+try:
+    import vtracer
+except ImportError:
+    vtracer = None
+
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Tags and attributes rewritten by Vectorizer.optimize_svg
+_OPTIMIZE_RE = re.compile(rb'(<path)|(fill="#000000")|(</svg>)')
+_PATH_OPEN = b'<path stroke="#000000" stroke-width="2" fill="none"'
+_ANIMATION_CSS = b"""
+            <style>
+                path {
+                    stroke-dasharray: 1000;
+                    stroke-dashoffset: 1000;
+                }
+            </style>
+            """
+
+
+def _autocontrast(pixels: np.ndarray, cutoff: int = 0) -> np.ndarray:
+    """Stretch the contrast of a grayscale image like ImageOps.autocontrast.
+
+    The histogram is trimmed by cutoff percent of pixels at each end and the
+    remaining range is mapped to 0-255 through a lookup table. Produces the
+    same pixels as Pillow, with the histogram walk done in NumPy.
+
+    Args:
+        pixels: 2D uint8 grayscale image
+        cutoff: Percentage of pixels to ignore at each end of the histogram
+
+    Returns:
+        np.ndarray: Contrast-stretched image
+    """
+    histogram = np.bincount(pixels.ravel(), minlength=256)
+    cut = int(histogram.sum()) * cutoff // 100
+
+    # Lowest and highest values left after removing cut pixels from each end
+    low = int(np.argmax(np.cumsum(histogram) > cut))
+    high = 255 - int(np.argmax(np.cumsum(histogram[::-1]) > cut))
+    if high <= low:
+        return pixels
+
+    scale = 255.0 / (high - low)
+    lut = np.clip(np.trunc(np.arange(256) * scale - low * scale), 0, 255).astype(np.uint8)
+    return lut[pixels]
+
 
 class Vectorizer:
     """Handles conversion of raster images (JPG/PNG) to vector SVG format using vtracer."""
@@ -24,7 +71,6 @@ class Vectorizer:
         output_width: int = settings.VIDEO_WIDTH,
         output_height: int = settings.VIDEO_HEIGHT,
         color_mode: str = "binary",
-        preset: str = "drawing",
         filter_speckle: int = 4,
         corner_threshold: float = 60.0,
         max_iterations: int = 10,
@@ -38,7 +84,6 @@ class Vectorizer:
             output_width: Output SVG width
             output_height: Output SVG height
             color_mode: Color mode ('binary', 'color', 'posterize')
-            preset: Preset optimization ('drawing', 'photo', 'pixel', 'none')
             filter_speckle: Filter speckles up to this size
             corner_threshold: Corner detection threshold (degrees)
             max_iterations: Maximum curve fitting iterations
@@ -49,13 +94,45 @@ class Vectorizer:
         self.output_width = output_width
         self.output_height = output_height
         self.color_mode = color_mode
-        self.preset = preset
         self.filter_speckle = filter_speckle
         self.corner_threshold = corner_threshold
         self.max_iterations = max_iterations
         self.splice_threshold = splice_threshold
         self.path_precision = path_precision
 
+        # optimize_svg output only depends on the output size, so build its
+        # replacements once; indexed by the _OPTIMIZE_RE group that matched
+        self._svg_open = f'<svg viewBox="0 0 {output_width} {output_height}"'.encode()
+        self._replacements = (
+            None,
+            _PATH_OPEN,
+            b'fill="none"',
+            _ANIMATION_CSS + b"</svg>",
+        )
+
+        if vtracer is None:
+            logger.warning(
+                "vtracer Python bindings not installed; "
+                "starting a vtracer process for every image"
+            )
+
+    def config_key(self) -> str:
+        """Describe the settings that affect generated output.
+
+        Returns:
+            String that changes whenever the output for a given input would
+        """
+        return repr((
+            self.output_width,
+            self.output_height,
+            self.color_mode,
+            self.filter_speckle,
+            self.corner_threshold,
+            self.max_iterations,
+            self.splice_threshold,
+            self.path_precision,
+        ))
+
     def preprocess_image(self, image_data: bytes) -> bytes:
         """Preprocess image for better vectorization.
 
@@ -75,16 +152,21 @@ class Vectorizer:
         img.thumbnail((self.output_width, self.output_height), Image.Resampling.LANCZOS)
 
         # Enhance contrast
-        img = ImageOps.autocontrast(img, cutoff=5)
+        img = Image.fromarray(_autocontrast(np.asarray(img), cutoff=5))
 
-        # Convert back to bytes
+        # Convert back to bytes; the PNG only carries pixels to vtracer, so
+        # skip deflate to make the encode and decode nearly free
         output = io.BytesIO()
-        img.save(output, format="PNG")
+        img.save(output, format="PNG", compress_level=0)
         return output.getvalue()
 
     def vectorize(self, image_data: bytes) -> str:
         """Convert raster image to SVG.
 
+        Uses the vtracer Python bindings in-process when they are installed,
+        so no files are written. Otherwise the vtracer executable is run on
+        a temporary copy of the image.
+
         Args:
             image_data: Raw image bytes
 
@@ -94,59 +176,80 @@ class Vectorizer:
         # Preprocess the image
         preprocessed_data = self.preprocess_image(image_data)
 
-        # Create temporary files for processing
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as temp_input:
-            temp_input.write(preprocessed_data)
-            temp_input_path = temp_input.name
+        if vtracer is not None:
+            try:
+                return vtracer.convert_raw_image_to_svg(
+                    preprocessed_data,
+                    img_format="png",
+                    colormode=self.color_mode,
+                    filter_speckle=self.filter_speckle,
+                    corner_threshold=int(self.corner_threshold),
+                    max_iterations=self.max_iterations,
+                    splice_threshold=int(self.splice_threshold),
+                    path_precision=self.path_precision,
+                )
+            except Exception as e:
+                logger.error(f"Vectorization error: {str(e)}")
+                raise Exception(f"Vectorization failed: {str(e)}")
+
+        return self._vectorize_cli(preprocessed_data)
 
-        temp_output_path = temp_input_path.replace(".png", ".svg")
+    def _vectorize_cli(self, preprocessed_data: bytes) -> str:
+        """Convert a preprocessed image to SVG with the vtracer executable.
 
-        try:
-            # Build vtracer command
-            cmd = [
-                self.vtracer_path,
-                "--input", temp_input_path,
-                "--output", temp_output_path,
-                "--mode", self.color_mode,
-                "--preset", self.preset,
-                "--filter-speckle", str(self.filter_speckle),
-                "--corner-threshold", str(self.corner_threshold),
-                "--max-iterations", str(self.max_iterations),
-                "--splice-threshold", str(self.splice_threshold),
-                "--path-precision", str(self.path_precision),
-            ]
-
-            # Run vtracer
-            logger.info(f"Running vtracer: {' '.join(cmd)}")
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+        Args:
+            preprocessed_data: Preprocessed PNG bytes
+
+        Returns:
+            str: SVG content
+        """
+        # The temporary directory removes both files on exit
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_input_path = os.path.join(temp_dir, "input.png")
+            temp_output_path = os.path.join(temp_dir, "output.svg")
+
+            try:
+                with open(temp_input_path, "wb") as f:
+                    f.write(preprocessed_data)
+
+                # Build vtracer command
+                cmd = [
+                    self.vtracer_path,
+                    "--input", temp_input_path,
+                    "--output", temp_output_path,
+                    "--mode", self.color_mode,
+                    "--filter-speckle", str(self.filter_speckle),
+                    "--corner-threshold", str(self.corner_threshold),
+                    "--max-iterations", str(self.max_iterations),
+                    "--splice-threshold", str(self.splice_threshold),
+                    "--path-precision", str(self.path_precision),
+                ]
+
+                # Run vtracer
+                logger.info(f"Running vtracer: {' '.join(cmd)}")
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
 
-            if result.returncode != 0:
-                logger.error(f"vtracer failed with error: {result.stderr}")
-                raise Exception(f"Vectorization failed: {result.stderr}")
+                if result.returncode != 0:
+                    logger.error(f"vtracer failed with error: {result.stderr}")
+                    raise Exception(f"Vectorization failed: {result.stderr}")
 
-            # Read the output SVG
-            with open(temp_output_path, "r") as f:
-                svg_content = f.read()
+                # Read the output SVG
+                with open(temp_output_path, "r") as f:
+                    svg_content = f.read()
 
-            return svg_content
+                return svg_content
 
-        except subprocess.CalledProcessError as e:
-            logger.error(f"vtracer process error: {e.stderr}")
-            raise Exception(f"Vectorization process error: {e.stderr}")
-        except Exception as e:
-            logger.error(f"Vectorization error: {str(e)}")
-            raise
-        finally:
-            # Clean up temporary files
-            if os.path.exists(temp_input_path):
-                os.unlink(temp_input_path)
-            if os.path.exists(temp_output_path):
-                os.unlink(temp_output_path)
+            except subprocess.CalledProcessError as e:
+                logger.error(f"vtracer process error: {e.stderr}")
+                raise Exception(f"Vectorization process error: {e.stderr}")
+            except Exception as e:
+                logger.error(f"Vectorization error: {str(e)}")
+                raise
 
     def optimize_svg(self, svg_content: str) -> str:
         """Optimize SVG for animation.
@@ -161,38 +264,18 @@ class Vectorizer:
             str: Optimized SVG content
         """
         try:
-            # Here we would use a proper SVG parser, but for simplicity
-            # we'll just do some basic string replacements
-
-            # Set viewBox if not present
-            if "viewBox" not in svg_content:
-                svg_content = svg_content.replace(
-                    "<svg", 
-                    f'<svg viewBox="0 0 {self.output_width} {self.output_height}"',
-                    1
-                )
-
-            # Set stroke properties for all paths if not present
-            svg_content = svg_content.replace(
-                "<path", 
-                '<path stroke="#000000" stroke-width="2" fill="none"',
-            )
-
-            # Remove any fill attributes
-            svg_content = svg_content.replace('fill="#000000"', 'fill="none"')
-            
-            # Add CSS for animation preparation
-            animation_css = """
-            <style>
-                path {
-                    stroke-dasharray: 1000;
-                    stroke-dashoffset: 1000;
-                }
-            </style>
-            """
-            svg_content = svg_content.replace("</svg>", f"{animation_css}</svg>")
-
-            return svg_content
+            data = svg_content.encode('utf-8')
+
+            # Set viewBox on the first <svg tag if not present anywhere
+            if b"viewBox" not in data:
+                data = data.replace(b"<svg", self._svg_open, 1)
+
+            # Set stroke properties for all paths, remove black fills and
+            # add CSS for animation preparation in a single regex pass
+            replacements = self._replacements
+            return _OPTIMIZE_RE.sub(
+                lambda match: replacements[match.lastindex], data
+            ).decode('utf-8')
         except Exception as e:
             logger.error(f"SVG optimization error: {str(e)}")
             # Return original if optimization fails
@@ -13,7 +13,11 @@ import bpy
 import sys
 import os
 import math
+import time
+import shutil
+import hashlib
 import argparse
+import numpy as np
 from mathutils import Vector
 
 
@@ -32,6 +36,17 @@ def parse_arguments():
     parser.add_argument('--width', type=int, default=1920, help='Output width')
     parser.add_argument('--height', type=int, default=1080, help='Output height')
     parser.add_argument('--hand-model', help='Path to hand model (optional)')
+    parser.add_argument(
+        '--cache-dir',
+        default=os.environ.get('HAND_FRAME_CACHE_DIR', '/var/cache/hand_frames'),
+        help='Directory for cached frame sequences (empty to disable)',
+    )
+    parser.add_argument(
+        '--cache-bytes',
+        type=int,
+        default=int(os.environ.get('HAND_FRAME_CACHE_BYTES', 2 * 1024 ** 3)),
+        help='Total size of cached frame sequences to keep',
+    )
     
     return parser.parse_args(argv)
 
@@ -48,6 +63,7 @@ def setup_scene(width, height):
     bpy.context.scene.render.film_transparent = True  # Transparent background
     bpy.context.scene.render.image_settings.file_format = 'PNG'
     bpy.context.scene.render.image_settings.color_mode = 'RGBA'
+    # 15% is zlib's fastest level; mostly transparent frames shrink a lot
     bpy.context.scene.render.image_settings.compression = 15
     
     # Set up lighting
@@ -118,45 +134,43 @@ def create_hand_model():
     return gpencil
 
 
+def set_keyframes(action, data_path, frames, channels):
+    """Key every channel of a property on all frames with one batch call each."""
+    for index, values in enumerate(channels):
+        fcurve = action.fcurves.new(data_path=data_path, index=index)
+        fcurve.keyframe_points.add(len(frames))
+        fcurve.keyframe_points.foreach_set(
+            "co", np.column_stack((frames, values)).ravel()
+        )
+        # Recompute the Bezier handles keyframe_insert would have set
+        fcurve.update()
+
+
 def create_animation(hand, num_frames):
     """Create hand animation for drawing motion."""
-    # Define animation path (simplified circular motion)
-    def path_function(frame):
-        """Generate position for a given frame."""
-        progress = frame / num_frames
-        radius = 3.0
-        angle = progress * 2 * math.pi * 2  # Two full circles
-        
-        x = radius * math.cos(angle)
-        y = radius * math.sin(angle)
-        
-        # Add some variation to simulate drawing
-        variation = math.sin(progress * 12 * math.pi) * 0.5
-        
-        return x + variation, y + variation, 0
-    
-    # Set up animation
-    for frame in range(num_frames):
-        # Set current frame
-        bpy.context.scene.frame_set(frame)
-        
-        # Calculate position
-        x, y, z = path_function(frame)
-        
-        # Set hand position
-        hand.location = (x, y, z)
-        
-        # Set rotation to follow path tangent
-        if frame > 0:
-            prev_x, prev_y, _ = path_function(frame - 1)
-            dx = x - prev_x
-            dy = y - prev_y
-            angle = math.atan2(dy, dx)
-            hand.rotation_euler = (0, 0, angle)
-        
-        # Insert keyframes
-        hand.keyframe_insert(data_path="location", frame=frame)
-        hand.keyframe_insert(data_path="rotation_euler", frame=frame)
+    # Define animation path (simplified circular motion), all frames at once
+    frames = np.arange(num_frames, dtype=np.float32)
+    progress = frames / num_frames
+    radius = 3.0
+    angle = progress * 2 * np.pi * 2  # Two full circles
+    
+    # Add some variation to simulate drawing
+    variation = np.sin(progress * 12 * np.pi) * 0.5
+    
+    x = radius * np.cos(angle) + variation
+    y = radius * np.sin(angle) + variation
+    zeros = np.zeros(num_frames, dtype=np.float32)
+    
+    # Rotate to follow the path tangent; the first frame keeps no rotation
+    heading = zeros.copy()
+    heading[1:] = np.arctan2(np.diff(y), np.diff(x))
+    
+    # Write the keyframes straight into the action's F-curves
+    hand.animation_data_create()
+    action = bpy.data.actions.new(name="HandAction")
+    hand.animation_data.action = action
+    set_keyframes(action, "location", frames, (x, y, zeros))
+    set_keyframes(action, "rotation_euler", frames, (zeros, zeros, heading))
     
     # Set animation range
     bpy.context.scene.frame_start = 0
@@ -168,15 +182,148 @@ def render_animation(output_dir, num_frames):
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
     
-    # Set output path
-    bpy.context.scene.render.filepath = os.path.join(output_dir, "hand_")
+    # Set output path; Blender appends the zero-padded frame number and
+    # extension, producing hand_0000.png, hand_0001.png, ...
+    scene = bpy.context.scene
+    scene.render.filepath = os.path.join(output_dir, "hand_")
+    scene.frame_start = 0
+    scene.frame_end = num_frames - 1
+    
+    # Render the whole sequence in one call so the evaluated scene stays warm
+    bpy.ops.render.render(animation=True)
+
+
+def file_digest(path):
+    """Return the SHA-1 hex digest of a file's contents."""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def frame_cache_dir(args):
+    """Return the cache directory for this frame sequence, or None if disabled.
+
+    The key covers everything the frames depend on: the resolution, the
+    frame count, the hand model and this script itself.
+    """
+    if not args.cache_dir:
+        return None
+    
+    model_sha = 'builtin'
+    if args.hand_model and os.path.exists(args.hand_model):
+        model_sha = file_digest(args.hand_model)
+    script_sha = file_digest(__file__) if '__file__' in globals() else ''
+    
+    key = f"{args.width}x{args.height}x{args.frames}x{model_sha}x{script_sha}"
+    return os.path.join(args.cache_dir, hashlib.sha1(key.encode()).hexdigest())
+
+
+# Unpublished render directories untouched for this long are abandoned
+STALE_RENDER_SECONDS = 10 * 60
+
+
+def link_cached_frames(cache_dir, output_dir, num_frames):
+    """Symlink a cached frame sequence into the output directory.
+
+    Returns:
+        True if a complete cached sequence was found and linked
+    """
+    names = [f"hand_{frame:04d}.png" for frame in range(num_frames)]
+    if not all(os.path.exists(os.path.join(cache_dir, name)) for name in names):
+        return False
+    
+    os.makedirs(output_dir, exist_ok=True)
+    for name in names:
+        os.symlink(os.path.join(cache_dir, name), os.path.join(output_dir, name))
+    
+    # Mark as recently used for eviction
+    os.utime(cache_dir)
+    return True
+
+
+def published_frame_dirs(cache_root):
+    """Return (entry link, frame directory) for every published cache entry."""
+    return [
+        (entry.path, os.path.realpath(entry.path))
+        for entry in os.scandir(cache_root)
+        if entry.is_symlink()
+    ]
+
+
+def sweep_stale_renders(cache_root):
+    """Remove frame directories left by renders that were killed or lost a race."""
+    published = {frames_dir for _, frames_dir in published_frame_dirs(cache_root)}
+    cutoff = time.time() - STALE_RENDER_SECONDS
+    for entry in os.scandir(cache_root):
+        if (
+            entry.is_dir(follow_symlinks=False)
+            and os.path.realpath(entry.path) not in published
+            and entry.stat(follow_symlinks=False).st_mtime < cutoff
+        ):
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def start_cached_render(cache_dir, output_dir):
+    """Point the output directory at a fresh frame directory inside the cache.
+
+    Blender then renders straight into the cache while the renderer reads
+    the frames through the output path as they appear, so nothing is copied.
+
+    Returns:
+        The frame directory, or None if frames cannot be cached
+    """
+    frames_dir = f"{cache_dir}.tmp-{os.getpid()}"
+    try:
+        os.makedirs(frames_dir)
+        try:
+            # The renderer creates the output directory empty
+            os.rmdir(output_dir)
+        except FileNotFoundError:
+            pass
+        os.symlink(frames_dir, output_dir)
+    except OSError as e:
+        print(f"Not caching hand frames: {e}")
+        shutil.rmtree(frames_dir, ignore_errors=True)
+        os.makedirs(output_dir, exist_ok=True)
+        return None
+    return frames_dir
+
+
+def publish_cached_frames(cache_dir, frames_dir, max_bytes):
+    """Publish a finished frame directory and evict least recently used entries.
+
+    The entry is a symlink swapped into place atomically, so readers never
+    see a partial sequence and the frame directory itself never moves while
+    the renderer may still be reading it.
+    """
+    cache_root = os.path.dirname(cache_dir)
+    link_path = f"{frames_dir}.link"
+    try:
+        os.symlink(os.path.basename(frames_dir), link_path)
+        os.replace(link_path, cache_dir)
+    except OSError as e:
+        print(f"Not caching hand frames: {e}")
+        return
+    
+    entries = []
+    for entry_link, entry_dir in published_frame_dirs(cache_root):
+        try:
+            mtime = os.stat(entry_dir).st_mtime_ns
+            size = sum(frame.stat().st_size for frame in os.scandir(entry_dir))
+        except OSError:
+            continue
+        entries.append((entry_dir == os.path.realpath(frames_dir), mtime, size, entry_link, entry_dir))
     
-    # Render frames
-    for frame in range(num_frames):
-        bpy.context.scene.frame_set(frame)
-        bpy.context.scene.render.filepath = os.path.join(output_dir, f"hand_{frame:04d}.png")
-        bpy.ops.render.render(write_still=True)
-        print(f"Rendered frame {frame+1}/{num_frames}")
+    # Keep the newest entries that fit, always including the one just stored
+    entries.sort(reverse=True)
+    total = 0
+    for is_new, _, size, entry_link, entry_dir in entries:
+        total += size
+        if total > max_bytes and not is_new:
+            os.unlink(entry_link)
+            shutil.rmtree(entry_dir, ignore_errors=True)
 
 
 def main():
@@ -184,6 +331,20 @@ def main():
     # Parse arguments
     args = parse_arguments()
     
+    # Reuse a previously rendered sequence; the frames are deterministic
+    cache_dir = frame_cache_dir(args)
+    if cache_dir:
+        try:
+            os.makedirs(args.cache_dir, exist_ok=True)
+            sweep_stale_renders(args.cache_dir)
+        except OSError as e:
+            print(f"Not caching hand frames: {e}")
+            cache_dir = None
+    if cache_dir and link_cached_frames(cache_dir, args.output, args.frames):
+        print(f"Animation complete. Cached frames linked to {args.output}")
+        return
+    frames_dir = start_cached_render(cache_dir, args.output) if cache_dir else None
+    
     # Setup scene
     camera = setup_scene(args.width, args.height)
     
@@ -208,6 +369,9 @@ def main():
     # Render animation
     render_animation(args.output, args.frames)
     
+    if frames_dir:
+        publish_cached_frames(cache_dir, frames_dir, args.cache_bytes)
+    
     print(f"Animation complete. Frames saved to {args.output}")
 
 
@@ -0,0 +1,171 @@
+"""Tests for the animator module."""
+
+import re
+import numpy as np
+import pytest
+import xml.etree.ElementTree as ET
+from unittest.mock import patch
+
+from app.animator import Animator, _Prepared
+
+
+SAMPLE_SVG = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+    'width="800" height="600" viewBox="0 0 800 600">'
+    '<g><path d="M10 10 L90 90" stroke="#ff0000" /></g>'
+    '<path d="M0 0 C10 10 20 20 30 30 L40 40 Z" fill="#000000" />'
+    '</svg>'
+)
+
+
+class TestAnimator:
+    """Tests for the Animator class."""
+
+    def test_parse_svg_with_namespaces(self):
+        """Test that namespaced paths are found without stripping xmlns."""
+        animator = Animator(width=800, height=600)
+
+        svg_attrs, paths = animator._parse_svg(SAMPLE_SVG)
+
+        assert svg_attrs['viewBox'] == "0 0 800 600"
+        assert len(paths) == 2
+        assert paths[0]['d'] == "M10 10 L90 90"
+        assert paths[0]['stroke'] == "#ff0000"
+        assert paths[1]['fill'] == "#000000"
+
+    def test_parse_svg_without_namespace(self):
+        """Test parsing of plain SVG without a default namespace."""
+        animator = Animator(width=800, height=600)
+
+        svg_attrs, paths = animator._parse_svg('<svg><path d="M1 1 L2 2" /></svg>')
+
+        assert svg_attrs['viewBox'] == "0 0 800 600"
+        assert [p['d'] for p in paths] == ["M1 1 L2 2"]
+
+    def test_parse_invalid_svg(self):
+        """Test that invalid SVG falls back to defaults."""
+        animator = Animator(width=800, height=600)
+
+        svg_attrs, paths = animator._parse_svg("not an svg")
+
+        assert svg_attrs['width'] == "800"
+        assert paths == []
+
+    def test_estimate_path_lengths(self):
+        """Test path length estimation from command and number counts."""
+        animator = Animator()
+        paths = [
+            {'d': "M10 10 L90 90"},
+            {'d': "M0 0 " + "L1.5 -1 " * 30},
+        ]
+
+        lengths = animator._estimate_path_lengths(paths)
+
+        # Short paths are clamped to the minimum length
+        assert lengths[0] == 100
+        # 31 commands * 10 + 31 points * 5
+        assert lengths[1] == 465
+
+    def test_calculate_path_lengths(self):
+        """Test that path lengths follow the path geometry."""
+        pytest.importorskip("svgpathtools")
+        animator = Animator()
+        paths = [
+            {'d': "M0 0 L300 400"},
+            {'d': "M0 0 L3 4"},
+        ]
+
+        lengths = animator._calculate_path_lengths(paths)
+
+        assert lengths[0] == pytest.approx(500.0)
+        # Short paths are clamped to the minimum length
+        assert lengths[1] == 100.0
+
+    def test_create_animated_svg(self):
+        """Test that every path gets a dash offset animation."""
+        animator = Animator(width=800, height=600, background_color="#ffffff")
+
+        result = animator.create_animated_svg(SAMPLE_SVG)
+
+        root = ET.fromstring(result)
+        ns = {'svg': 'http://www.w3.org/2000/svg'}
+        assert root.get('viewBox') == "0 0 800 600"
+        assert root.find('svg:rect', ns).get('fill') == "#ffffff"
+        paths = root.findall('svg:path', ns)
+        assert len(paths) == 2
+        for path in paths:
+            animate = path.find('svg:animate', ns)
+            assert animate.get('attributeName') == "stroke-dashoffset"
+            assert animate.get('from') == path.get('stroke-dasharray')
+
+    def test_create_animated_svg_is_memoized(self):
+        """Test that repeated calls with the same input reuse the result."""
+        animator = Animator()
+
+        with patch.object(
+            Animator, '_build_animated_svg', return_value="<svg/>"
+        ) as mock_build:
+            first = animator.create_animated_svg(SAMPLE_SVG)
+            second = animator.create_animated_svg(SAMPLE_SVG)
+
+            assert first == second == "<svg/>"
+            assert mock_build.call_count == 1
+
+            # Changing a setting must not return the stale result
+            animator.stroke_width = 4.0
+            animator.create_animated_svg(SAMPLE_SVG)
+            assert mock_build.call_count == 2
+
+    def test_storyboard_frames(self):
+        """Test that storyboard frames draw paths progressively."""
+        animator = Animator(width=800, height=600)
+
+        with patch.object(Animator, '_calculate_path_lengths', return_value=[100.0, 300.0]):
+            frames = list(animator.storyboard_frames(SAMPLE_SVG, num_frames=3))
+
+        assert len(frames) == 3
+        # Nothing drawn yet: first path is fully hidden by its dash offset
+        assert frames[0].count('<path') == 1
+        assert float(re.search(r'stroke-dashoffset="([^"]+)"', frames[0]).group(1)) == 100.0
+        # Halfway: first path complete, second one a third of the way in
+        assert frames[1].count('<path') == 2
+        offset = float(re.search(r'stroke-dashoffset="([^"]+)"', frames[1]).group(1))
+        assert offset == pytest.approx(200.0)
+        # Last frame: everything fully drawn
+        assert frames[2].count('<path') == 2
+        assert 'stroke-dasharray' not in frames[2]
+
+    def test_storyboard_deltas(self):
+        """Test that deltas carry each completed path once plus the partial path."""
+        animator = Animator(width=800, height=600, background_color="#ffffff")
+
+        with patch.object(Animator, '_calculate_path_lengths', return_value=[100.0, 300.0]):
+            deltas = list(animator.storyboard_deltas(SAMPLE_SVG, num_frames=3))
+
+        assert len(deltas) == 3
+        # First frame: background only, first path partially drawn
+        completed, partial = deltas[0]
+        assert '<rect' in completed and '<path' not in completed
+        assert partial.count('<path') == 1 and '<rect' not in partial
+        # Halfway: first path completes, second one is partial
+        completed, partial = deltas[1]
+        assert completed.count('<path') == 1 and '<rect' not in completed
+        assert 'stroke-dashoffset' in partial
+        # Last frame: second path completes, nothing left partial
+        completed, partial = deltas[2]
+        assert completed.count('<path') == 1
+        assert partial is None
+
+    def test_storyboard_last_frame_complete(self):
+        """Test that rounding in the total length cannot leave a path partial."""
+        animator = Animator(width=800, height=600)
+        lengths = [0.1, 0.1, 0.1, 0.3]
+        cumulative = np.cumsum(lengths)
+        # An exactly rounded total falls just short of the cumulative sum
+        prep = _Prepared({}, [{'d': "M0 0 L1 1"}] * 4, lengths, 0.6, cumulative)
+        assert prep.total_length < cumulative[-1]
+
+        steps = list(animator._storyboard_steps(prep, num_frames=3))
+
+        assert steps[-1][1] == ''
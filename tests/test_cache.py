@@ -0,0 +1,53 @@
+"""Tests for the cache module."""
+
+import io
+from unittest.mock import patch
+
+from app.cache import LazyCache, NullCache, make_key, read_with_digest
+
+
+class TestCache:
+    """Tests for cache keys and the fallback cache."""
+
+    def test_make_key_is_stable(self):
+        """Test that identical content and settings give the same key."""
+        assert make_key("svg", "abc", "(1, 2)") == make_key("svg", "abc", "(1, 2)")
+
+    def test_make_key_varies_with_inputs(self):
+        """Test that content, settings and namespace all change the key."""
+        key = make_key("svg", "abc", "(1, 2)")
+
+        assert key.startswith("svg:")
+        assert make_key("svg", "abd", "(1, 2)") != key
+        assert make_key("svg", "abc", "(1, 3)") != key
+        assert make_key("animated", "abc", "(1, 2)") != key
+
+    def test_read_with_digest(self):
+        """Test that chunked reads return the full content and a stable digest."""
+        data = bytes(range(256)) * 10
+
+        content, digest = read_with_digest(io.BytesIO(data), chunk_size=100)
+        _, whole_digest = read_with_digest(io.BytesIO(data))
+
+        assert content == data
+        assert digest == whole_digest
+        assert read_with_digest(io.BytesIO(data + b"x"))[1] != digest
+
+    def test_null_cache(self):
+        """Test that the fallback cache never returns a stored value."""
+        cache = NullCache()
+
+        cache.set("key", "value")
+
+        assert cache.get("key") is None
+
+    def test_lazy_cache_connects_on_first_use(self):
+        """Test that Redis is contacted only on first use, falling back once."""
+        with patch('app.cache.RedisCache', side_effect=ConnectionError("down")) as mock_redis:
+            cache = LazyCache()
+            assert not mock_redis.called
+
+            cache.set("key", "value")
+
+            assert cache.get("key") is None
+            assert mock_redis.call_count == 1
@@ -0,0 +1,115 @@
+"""Tests for the renderer module."""
+
+import os
+from unittest.mock import patch
+
+import numpy as np
+from PIL import Image
+
+from app.renderer import Renderer, _blend_over, _composite_over
+
+
+def _fake_rasterize(svg_data, width, height):
+    """Stand-in rasterizer that reports its input and worker process."""
+    return np.array([int(svg_data), os.getpid()])
+
+
+class TestRenderer:
+    """Tests for the Renderer class."""
+
+    def test_blend_over(self):
+        """Test that the overlay is blended by its alpha onto the base."""
+        base = np.zeros((2, 2, 4), dtype=np.uint8)
+        base[..., 0] = 200
+        overlay = np.zeros((2, 2, 4), dtype=np.uint8)
+        overlay[..., 2] = 255
+        overlay[0, 0, 3] = 255
+        overlay[0, 1, 3] = 51
+
+        blended = _blend_over(base, overlay)
+
+        # Opaque overlay pixel replaces the base
+        assert blended[0, 0].tolist() == [0, 0, 255, 255]
+        # Partially transparent pixel mixes both colors
+        assert blended[0, 1].tolist() == [160, 0, 51, 255]
+        # Fully transparent pixel keeps the base color
+        assert blended[1, 1].tolist() == [200, 0, 0, 255]
+
+    def test_composite_over_transparent_base(self):
+        """Test the over operator where the base is not opaque."""
+        base = np.zeros((1, 3, 4), dtype=np.uint8)
+        base[0, 1] = [255, 0, 0, 255]
+        base[0, 2] = [255, 0, 0, 128]
+        layer = np.zeros((1, 3, 4), dtype=np.uint8)
+        layer[..., :] = [0, 0, 255, 128]
+
+        composited = _composite_over(base, layer)
+
+        # Over a transparent pixel the layer is kept as is
+        assert composited[0, 0].tolist() == [0, 0, 255, 128]
+        # Over an opaque pixel the result is opaque
+        assert composited[0, 1].tolist() == [127, 0, 128, 255]
+        # Over a translucent pixel alpha accumulates
+        assert composited[0, 2].tolist() == [85, 0, 170, 192]
+
+    def test_compose_frames(self, tmp_path):
+        """Test that hand frames are composed and extra frames pass through."""
+        renderer = Renderer(width=4, height=2)
+        hand_path = tmp_path / "hand_0000.png"
+        Image.new("RGBA", (4, 2), (0, 255, 0, 255)).save(hand_path)
+        drawing_frames = [np.full((2, 4, 4), 255, dtype=np.uint8) for _ in range(2)]
+
+        composed = list(renderer.compose_frames(drawing_frames, [str(hand_path)]))
+
+        assert len(composed) == 2
+        assert composed[0][0, 0].tolist() == [0, 255, 0, 255]
+        assert composed[1] is drawing_frames[1]
+
+    def test_compose_frames_resizes_hand(self, tmp_path):
+        """Test that hand frames at another resolution are resized."""
+        renderer = Renderer(width=4, height=2)
+        hand_path = tmp_path / "hand_0000.png"
+        Image.new("RGBA", (8, 4), (0, 255, 0, 255)).save(hand_path)
+        drawing_frames = [np.full((2, 4, 4), 255, dtype=np.uint8)]
+
+        composed = list(renderer.compose_frames(drawing_frames, [str(hand_path)]))
+
+        assert composed[0].shape == (2, 4, 4)
+        assert composed[0][1, 3].tolist() == [0, 255, 0, 255]
+
+    def test_render_svg_batch_parallel(self):
+        """Test that frames are rasterized in worker processes, in order."""
+        renderer = Renderer(width=1, height=1)
+
+        with patch('app.renderer.os.cpu_count', return_value=2), \
+                patch('app.renderer._rasterize', _fake_rasterize):
+            frames = list(renderer._render_svg_batch(str(i) for i in range(10)))
+
+        assert [int(frame[0]) for frame in frames] == list(range(10))
+        assert os.getpid() not in {int(frame[1]) for frame in frames}
+
+    def test_iter_hand_frames(self, tmp_path):
+        """Test that frames are yielded as Blender writes them, in order."""
+        renderer = Renderer(width=1, height=1)
+        renderer.total_frames = 5
+        hand_dir = tmp_path / "hand"
+        hand_dir.mkdir()
+
+        class FakeBlender:
+            """Writes one frame per poll and exits after three frames."""
+
+            returncode = None
+            written = 0
+
+            def poll(self):
+                if self.written == 3:
+                    self.returncode = 0
+                    return 0
+                (hand_dir / f"hand_{self.written:04d}.png").touch()
+                self.written += 1
+                return None
+
+        with patch('app.renderer.HAND_FRAME_POLL_INTERVAL', 0):
+            frames = list(renderer._iter_hand_frames(FakeBlender(), str(tmp_path)))
+
+        assert frames == [str(hand_dir / f"hand_{i:04d}.png") for i in range(3)]
@@ -0,0 +1,33 @@
+"""Tests for the storage module."""
+
+import io
+
+from app.storage import MockStorage
+
+
+class TestMockStorage:
+    """Tests for the in-memory storage fallback."""
+
+    def test_upload_copies_buffer(self):
+        """Test that the stored file does not depend on the caller's buffer."""
+        storage = MockStorage()
+
+        with io.BytesIO(b"hello") as buffer:
+            storage.upload_file(buffer, "x")
+            buffer.seek(0)
+            buffer.write(b"HELLO, world")
+
+        file_obj, content_type = storage.download_file("x")
+        assert file_obj.read() == b"hello"
+        assert content_type == "application/octet-stream"
+
+    def test_upload_from_current_position(self):
+        """Test that only the unread part of a buffer is stored."""
+        storage = MockStorage()
+        buffer = io.BytesIO(b"skip-keep")
+        buffer.seek(5)
+
+        storage.upload_file(buffer, "x", "text/plain")
+
+        assert storage.files["x"]["content"] == b"keep"
+        assert storage.files["x"]["size"] == 4
@@ -0,0 +1,74 @@
+"""Tests for the tasks module."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db import Base
+from app.models import Job, JobStatus
+from app.tasks import _claim_job, celery_app, enqueue_many
+
+
+@pytest.fixture
+async def session(tmp_path):
+    """Session on a throwaway SQLite database."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)() as session:
+        yield session
+    await engine.dispose()
+
+
+class TestTasks:
+    """Tests for task dispatch helpers."""
+
+    def test_enqueue_many_shares_one_producer(self):
+        """Test that every job is sent through the same producer."""
+        producer = MagicMock()
+        acquire = MagicMock()
+        acquire.return_value.__enter__.return_value = producer
+
+        with patch.object(celery_app, 'producer_or_acquire', acquire), \
+                patch.object(celery_app, 'send_task') as mock_send:
+            enqueue_many([(1, "uploads/a.png"), (2, "uploads/b.png"), (3, "uploads/c.png")])
+
+        acquire.assert_called_once()
+        assert [c.kwargs['producer'] for c in mock_send.call_args_list] == [producer] * 3
+        assert [c.kwargs['args'] for c in mock_send.call_args_list] == [
+            [1, "uploads/a.png"],
+            [2, "uploads/b.png"],
+            [3, "uploads/c.png"],
+        ]
+        assert all(c.args == ("app.tasks.process_sketch",) for c in mock_send.call_args_list)
+
+    @pytest.mark.parametrize(
+        "status, age, claimable",
+        [
+            (JobStatus.PENDING, timedelta(0), True),
+            (JobStatus.FAILED, timedelta(0), True),
+            (JobStatus.PROCESSING, timedelta(0), False),
+            (JobStatus.PROCESSING, timedelta(days=1), True),
+            (JobStatus.COMPLETED, timedelta(days=1), False),
+        ],
+    )
+    async def test_claim_job(self, session, status, age, claimable):
+        """Test which jobs can be claimed, including retries after failures."""
+        session.add(Job(
+            status=status,
+            original_filename="sketch.png",
+            input_path="uploads/sketch.png",
+            error_message="earlier failure",
+            updated_at=datetime.now(timezone.utc) - age,
+        ))
+        await session.commit()
+
+        job = await _claim_job(session, 1)
+
+        assert (job is not None) == claimable
+        if claimable:
+            assert job.status == JobStatus.PROCESSING
+            assert job.error_message is None
@@ -7,9 +7,10 @@ import tempfile
 import xml.etree.ElementTree as ET
 import subprocess
 from io import BytesIO
-from PIL import Image
+import numpy as np
+from PIL import Image, ImageOps
 
-from app.vectorizer import Vectorizer
+from app.vectorizer import Vectorizer, _autocontrast
 
 
 def create_test_image(width=100, height=100):
@@ -34,7 +35,6 @@ class TestVectorizer:
         vectorizer = Vectorizer()
         assert vectorizer.vtracer_path == "vtracer"
         assert vectorizer.color_mode == "binary"
-        assert vectorizer.preset == "drawing"
 
     def test_preprocess_image(self):
         """Test image preprocessing."""
@@ -51,6 +51,32 @@ class TestVectorizer:
         img = Image.open(BytesIO(processed_data))
         assert img.mode == 'L'  # Should be grayscale
 
+    def test_vectorize_bindings(self):
+        """Test that vectorize uses the vtracer bindings when installed."""
+        mock_vtracer = MagicMock()
+        mock_vtracer.convert_raw_image_to_svg.return_value = "<svg></svg>"
+
+        with patch('app.vectorizer.vtracer', mock_vtracer), patch('subprocess.run') as mock_run:
+            vectorizer = Vectorizer()
+            result = vectorizer.vectorize(create_test_image())
+
+        assert result == "<svg></svg>"
+        assert not mock_run.called
+        args, kwargs = mock_vtracer.convert_raw_image_to_svg.call_args
+        assert Image.open(BytesIO(args[0])).format == "PNG"
+        assert kwargs["img_format"] == "png"
+        assert kwargs["colormode"] == "binary"
+
+    def test_autocontrast_matches_pillow(self):
+        """Test that the NumPy contrast stretch matches ImageOps.autocontrast."""
+        rng = np.random.default_rng(0)
+        pixels = rng.normal(128, 30, (64, 64)).clip(0, 255).astype(np.uint8)
+
+        expected = np.asarray(ImageOps.autocontrast(Image.fromarray(pixels), cutoff=5))
+
+        assert np.array_equal(_autocontrast(pixels, cutoff=5), expected)
+
+    @patch('app.vectorizer.vtracer', None)
     @patch('subprocess.run')
     def test_vectorize_subprocess_call(self, mock_run):
         """Test that vectorize calls the vtracer subprocess with correct args."""
@@ -59,24 +85,25 @@ class TestVectorizer:
         mock_process.returncode = 0
         mock_run.return_value = mock_process
         
-        # Setup temp file mock
-        with patch('tempfile.NamedTemporaryFile'):
-            with patch("builtins.open", mock_open(read_data="<svg></svg>")):
-                vectorizer = Vectorizer()
-                test_image = create_test_image()
-                
-                # Call the function
-                result = vectorizer.vectorize(test_image)
-                
-                # Check subprocess was called
-                assert mock_run.called
-                
-                # Check correct arguments
-                args = mock_run.call_args[0][0]
-                assert args[0] == "vtracer"
-                assert "--mode" in args
-                assert "binary" in args
+        # Setup file mock
+        with patch("builtins.open", mock_open(read_data="<svg></svg>")):
+            vectorizer = Vectorizer()
+            test_image = create_test_image()
+            
+            # Call the function
+            result = vectorizer.vectorize(test_image)
+            
+            # Check subprocess was called
+            assert mock_run.called
+            assert result == "<svg></svg>"
+            
+            # Check correct arguments
+            args = mock_run.call_args[0][0]
+            assert args[0] == "vtracer"
+            assert "--mode" in args
+            assert "binary" in args
 
+    @patch('app.vectorizer.vtracer', None)
     @patch('subprocess.run')
     def test_vectorize_error_handling(self, mock_run):
         """Test error handling in vectorize method."""